@@ -0,0 +1,55 @@
+# scripts/Agenda.py
+
+import heapq
+from itertools import count
+
+
+class Agenda:
+    """ Eventos "me acorde no tick T" (heap ordenado por tick).
+
+    Quem espera não custa nada entre um evento e outro: em vez de cada torre
+    decrementar o próprio cooldown todo tick, ela agenda o tick em que precisa
+    agir. Cada tick a Simulation executa os eventos vencidos, fase por fase
+    (na mesma ordem das fases do _tick).
+
+    Eventos do mesmo tick e fase rodam na ordem em que foram agendados, então
+    a ordem é determinística (a mesma semente dá a mesma partida).
+    """
+
+    # Fases do tick, na ordem em que a Simulation as executa
+    FASE_SPAWN_INIMIGO = 0
+    FASE_SPAWN_ENERGIA = 1
+    FASE_ENERGIAS = 2
+    FASE_TORRES = 3
+
+    def __init__(self):
+        self._heap = []
+        self._sequencia = count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def agendar(self, tick, fase, callback):
+        """ Chama callback() no tick/fase dados. Retorna o evento (para cancelar). """
+        evento = [tick, fase, next(self._sequencia), callback]
+        heapq.heappush(self._heap, evento)
+        return evento
+
+    @staticmethod
+    def cancelar(evento):
+        """ O evento fica no heap, mas não é mais chamado. """
+        if evento is not None:
+            evento[3] = None
+
+    @staticmethod
+    def sequencia(evento):
+        """ Posição do evento na ordem de agendamento (para o Snapshot refazer a mesma ordem). """
+        return evento[2] if evento is not None and evento[3] is not None else -1
+
+    def executar(self, tick, fase):
+        """ Chama os eventos vencidos até (tick, fase), inclusive. """
+        heap = self._heap
+        while heap and (heap[0][0] < tick or (heap[0][0] == tick and heap[0][1] <= fase)):
+            callback = heapq.heappop(heap)[3]
+            if callback is not None:
+                callback()
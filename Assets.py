@@ -0,0 +1,145 @@
+# scripts/Assets.py
+
+import os
+import struct
+
+import pygame
+
+from .Registro import log
+
+
+class GerenciadorAssets:
+    """ Imagens do jogo, carregadas na primeira vez que são pedidas.
+
+    - Com janela aberta, cada imagem é convertida uma vez para o formato da
+      tela (convert_alpha), e os blits não precisam converter pixel a pixel.
+    - Com cache (pasta), a imagem já decodificada fica salva em disco como
+      RGBA cru; da próxima vez não é preciso decodificar o PNG. O cache é
+      refeito se o PNG mudar (data de modificação diferente).
+    - Com atlas=True, todos os sprites são carregados de uma vez e empacotados
+      numa única Surface; cada imagem vira uma subsurface dela.
+    - Imagem desconhecida ou arquivo faltando: placeholder colorido (o aviso
+      é impresso uma vez só por imagem).
+    """
+
+    # (categoria, nome) -> arquivo dentro da pasta de imagens
+    CAMINHOS = {
+        ("projetil", "proje"): "projetil/proje.png",
+        ("energia", "energia"): "Energia.png",
+        ("torre", "peashooter"): "torres/peashooter.png",
+        ("torre", "noz"): "torres/noz.png",
+        ("torre", "girassol"): "torres/girassol.png",
+        ("torre", "cereja"): "torres/cereja.png",
+        ("inimigo", "basico"): "inimigos/basico.png",
+    }
+
+    CORES_PLACEHOLDER = {
+        "torre": (0, 150, 0),  # Verde para torres
+        "inimigo": (255, 0, 0),  # Vermelho para inimigos
+    }
+    TAMANHO_PLACEHOLDER = (40, 40)
+
+    LARGURA_ATLAS = 512
+    CABECALHO_CACHE = struct.Struct("<IIq")  # largura, altura, mtime_ns do PNG
+
+    def __init__(self, pasta="data/images", cache="data/cache", atlas=False):
+        self.pasta = pasta
+        self.cache = cache  # None = sem cache em disco
+        self.imagens = {}
+        self.atlas = None
+
+        if atlas and pygame.display.get_surface() is not None:
+            self.montar_atlas()
+
+    # ===================================================
+    # ACESSO
+    # ===================================================
+    def imagem(self, categoria, nome):
+        """ A Surface da imagem (sempre o mesmo objeto para a mesma imagem). """
+        chave = (categoria, nome)
+        img = self.imagens.get(chave)
+        if img is None:
+            img = self._converter(self._carregar(chave))
+            self.imagens[chave] = img
+        return img
+
+    def _converter(self, img):
+        # Sem janela (simulação sem tela) não há formato de tela para converter
+        if pygame.display.get_surface() is None:
+            return img
+        return img.convert_alpha()
+
+    def _carregar(self, chave):
+        categoria, nome = chave
+        try:
+            caminho = os.path.join(self.pasta, self.CAMINHOS[chave])
+            img = self._ler_cache(chave, caminho)
+            if img is None:
+                img = pygame.image.load(caminho)
+                self._escrever_cache(chave, caminho, img)
+            return img
+        except (KeyError, FileNotFoundError, pygame.error):
+            log.error("ERRO: Asset '%s' do tipo '%s' não encontrado. Usando placeholder.", categoria, nome)
+            img = pygame.Surface(self.TAMANHO_PLACEHOLDER)
+            img.fill(self.CORES_PLACEHOLDER.get(categoria, (255, 0, 255)))
+            return img
+
+    # ===================================================
+    # CACHE EM DISCO
+    # ===================================================
+    def _arquivo_cache(self, chave):
+        return os.path.join(self.cache, f"{chave[0]}_{chave[1]}.rgba")
+
+    def _ler_cache(self, chave, caminho):
+        if self.cache is None:
+            return None
+        try:
+            with open(self._arquivo_cache(chave), "rb") as arquivo:
+                largura, altura, mtime = self.CABECALHO_CACHE.unpack(arquivo.read(self.CABECALHO_CACHE.size))
+                if mtime != os.stat(caminho).st_mtime_ns:
+                    return None
+                return pygame.image.frombytes(arquivo.read(), (largura, altura), "RGBA")
+        except (OSError, struct.error, ValueError):
+            return None
+
+    def _escrever_cache(self, chave, caminho, img):
+        if self.cache is None:
+            return
+        try:
+            os.makedirs(self.cache, exist_ok=True)
+            with open(self._arquivo_cache(chave), "wb") as arquivo:
+                arquivo.write(self.CABECALHO_CACHE.pack(*img.get_size(), os.stat(caminho).st_mtime_ns))
+                arquivo.write(pygame.image.tobytes(img, "RGBA"))
+        except OSError:
+            pass  # Sem cache: da próxima vez o PNG é decodificado de novo
+
+    # ===================================================
+    # ATLAS
+    # ===================================================
+    def montar_atlas(self):
+        """ Empacota todos os sprites conhecidos numa Surface só (prateleiras por altura).
+
+        Precisa da janela aberta (o atlas fica no formato da tela).
+        """
+        sprites = {chave: self._carregar(chave).convert_alpha() for chave in self.CAMINHOS}
+
+        posicoes = {}
+        x = y = altura_prateleira = 0
+        for chave, img in sorted(sprites.items(), key=lambda item: -item[1].get_height()):
+            largura, altura = img.get_size()
+            if x and x + largura > self.LARGURA_ATLAS:
+                x = 0
+                y += altura_prateleira + 1
+                altura_prateleira = 0
+            posicoes[chave] = (x, y)
+            x += largura + 1
+            altura_prateleira = max(altura_prateleira, altura)
+
+        largura_total = max(posicoes[chave][0] + img.get_width() for chave, img in sprites.items())
+        self.atlas = pygame.Surface((largura_total, y + altura_prateleira), pygame.SRCALPHA).convert_alpha()
+        self.atlas.fill((0, 0, 0, 0))
+
+        for chave, img in sprites.items():
+            # BLEND_RGBA_MAX sobre o fundo zerado copia os pixels sem misturar o alpha
+            self.atlas.blit(img, posicoes[chave], special_flags=pygame.BLEND_RGBA_MAX)
+            self.imagens[chave] = self.atlas.subsurface(pygame.Rect(posicoes[chave], img.get_size()))
@@ -0,0 +1,252 @@
+# Benchmarks de desempenho (rodam sem janela)
+#
+#   python -m scripts.Benchmark memoria
+#   python -m scripts.Benchmark cenarios [--salvar base.json] [--comparar base.json] [--limite 0.15]
+
+import argparse
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+# Sem janela: o SDL usa o driver de vídeo "dummy"
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+from scripts.Simulacao import Simulation
+from scripts.Inimigos import Inimigo
+from scripts.Mecanicas import Energia
+from scripts.Torres import Peashooter, NozObstaculo, Girassol, CerejaBomba
+from scripts.Perfil import Perfilador
+
+
+# ===================================================
+# PEGADA DE MEMÓRIA POR ENTIDADE
+# ===================================================
+class _LayoutAntigo:
+    """ Objeto comum, com __dict__ por instância (como as entidades eram antes dos __slots__). """
+
+    def __init__(self, atributos):
+        for nome, valor in atributos.items():
+            setattr(self, nome, valor)
+
+
+def _atributos_antigos(obj):
+    """ Os atributos da entidade no layout antigo: pos (e a velocidade da Energia) como listas. """
+    atributos = {nome: getattr(obj, nome) for classe in reversed(type(obj).__mro__)
+                 for nome in getattr(classe, "__slots__", ()) if hasattr(obj, nome)}
+    atributos["pos"] = [atributos.pop("x"), atributos.pop("y")]
+    if "vx" in atributos:
+        atributos["velocidade"] = [atributos.pop("vx"), atributos.pop("vy")]
+    return atributos
+
+
+def _bytes_por_instancia(criar, quantidade):
+    instancias = []
+    tracemalloc.start()
+    inicio = tracemalloc.take_snapshot()
+    for i in range(quantidade):
+        instancias.append(criar(i))
+    fim = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    total = sum(stat.size_diff for stat in fim.compare_to(inicio, "filename"))
+    # Desconta a própria lista que guarda as instâncias
+    total -= sys.getsizeof(instancias)
+    return total / quantidade, instancias
+
+
+def pegada_memoria(quantidade=5000):
+    """ Bytes por entidade, com __slots__ (atual) e com __dict__ (antes).
+
+    O "antes" é a entidade atual menos o objeto com slots, mais um objeto comum
+    com os mesmos atributos no layout antigo (__dict__ e listas de pos/velocidade).
+    Os valores (floats, Rect, imagens) são os mesmos nos dois layouts.
+    """
+    sim = Simulation()
+
+    fabricas = {
+        Inimigo: lambda classe: lambda i: classe(jogo=sim, tipo="basico", pos=(i * 0.5, 100.0), row=0),
+        Energia: lambda classe: lambda i: classe(jogo=sim, pos=(i * 0.5, 0.0), velocidade=[0, 1]),
+    }
+    for classe_torre in (Peashooter, NozObstaculo, Girassol, CerejaBomba):
+        fabricas[classe_torre] = lambda classe: lambda i: classe(jogo=sim, pos=(i * 0.5, 100.0), grid_pos=(0, 0))
+
+    resultado = {}
+    for classe, fabrica in fabricas.items():
+        com_slots, entidades = _bytes_por_instancia(fabrica(classe), quantidade)
+        # Uma classe comum por entidade (o __dict__ compartilha as chaves entre instâncias da mesma classe)
+        antiga = type(classe.__name__ + "Antigo", (_LayoutAntigo,), {})
+        so_objeto, _ = _bytes_por_instancia(lambda i: antiga(_atributos_antigos(entidades[i])), quantidade)
+        com_dict = com_slots - sys.getsizeof(entidades[0]) + so_objeto
+        resultado[classe.__name__] = (com_dict, com_slots)
+    return resultado
+
+
+def _imprimir_memoria():
+    print(f"{'Entidade':<14}{'__dict__':>12}{'__slots__':>12}{'economia':>10}")
+    for nome, (com_dict, com_slots) in pegada_memoria().items():
+        economia = 1 - com_slots / com_dict
+        print(f"{nome:<14}{com_dict:>10.0f} B{com_slots:>10.0f} B{economia:>9.0%}")
+
+
+# ===================================================
+# CENÁRIOS DA SIMULAÇÃO
+# ===================================================
+def _adicionar_inimigo(sim, row, x):
+    """ Cria um inimigo básico na linha, como o spawn da Simulation faz. """
+    center_y = sim.get_cell_center(row, sim.GRID_COLS - 1)[1]
+    inimigo = Inimigo(
+        jogo=sim,
+        tipo="basico",
+        pos=(x, center_y - sim.assets.imagem("inimigo", "basico").get_height() // 2),
+        vida=10,
+        velocidade=sim.rng.uniform(0.1, 0.4),
+        dano=0.5,
+        row=row
+    )
+    sim.inimigos.append(inimigo)
+    sim.indice_inimigos.inserir(inimigo)
+
+
+def _preencher(sim, classe_torre, colunas=None):
+    for row in range(sim.GRID_ROWS):
+        for col in (colunas if colunas is not None else range(sim.GRID_COLS)):
+            sim.colocar_torre(classe_torre, row, col)
+
+
+def cenario_peashooters(sim):
+    """ Todas as células com Peashooter e alvos chegando em todas as linhas. """
+    _preencher(sim, Peashooter)
+    for row in range(sim.GRID_ROWS):
+        for i in range(20):
+            _adicionar_inimigo(sim, row, sim.borda_direita + 20 + i * 15)
+
+
+def cenario_horda(sim, inimigos_por_linha=200):
+    """ Centenas de inimigos por linha contra uma coluna de Peashooters. """
+    _preencher(sim, Peashooter, colunas=[0])
+    for row in range(sim.GRID_ROWS):
+        for i in range(inimigos_por_linha):
+            _adicionar_inimigo(sim, row, 300 + i * 4)
+
+
+def cenario_cerejas(sim):
+    """ Cerejas detonando sem parar no meio de uma horda que é reposta. """
+    cenario_horda(sim, inimigos_por_linha=100)
+
+    def a_cada_tick():
+        if sim.tick % 60 == 0:
+            for row in range(1, sim.GRID_ROWS, 3):
+                for col in range(2, sim.GRID_COLS, 3):
+                    sim.colocar_torre(CerejaBomba, row, col)
+        if len(sim.inimigos) < 300:
+            for row in range(sim.GRID_ROWS):
+                _adicionar_inimigo(sim, row, sim.rng.uniform(300, 700))
+
+    return a_cada_tick
+
+
+def cenario_girassois(sim):
+    """ Fazenda de Girassóis: todas as células produzindo Energia. """
+    _preencher(sim, Girassol)
+
+
+CENARIOS = {
+    "peashooters": cenario_peashooters,
+    "horda": cenario_horda,
+    "cerejas": cenario_cerejas,
+    "girassois": cenario_girassois,
+}
+
+
+def rodar_cenario(nome, ticks=600, aquecimento=60, semente=0):
+    """ Roda um cenário e retorna {"ticks_por_segundo": ..., "ms_por_fase": {...}}. """
+    sim = Simulation(semente=semente)
+    sim.total_energia = 10 ** 9
+    a_cada_tick = CENARIOS[nome](sim)
+
+    sim.step(aquecimento)
+
+    perfil = Perfilador(gravar=True)
+    sim.perfil = perfil
+    inicio = time.perf_counter()
+    for _ in range(ticks):
+        if a_cada_tick is not None:
+            a_cada_tick()
+        perfil.inicio_frame()
+        sim.step(1)
+        perfil.fim_frame(sim, 1)
+    duracao = time.perf_counter() - inicio
+
+    fases = [fase for fase in Perfilador.FASES if any(r[fase] for r in perfil.registros)]
+    return {
+        "ticks_por_segundo": ticks / duracao,
+        "ms_por_fase": {fase: sum(r[fase] for r in perfil.registros) / ticks / 1e6 for fase in fases},
+    }
+
+
+def rodar_cenarios(nomes=None, ticks=600):
+    return {nome: rodar_cenario(nome, ticks) for nome in (nomes or CENARIOS)}
+
+
+def comparar(resultados, base, limite):
+    """ Lista de (cenário, lentidão) dos cenários mais lentos que a base além do limite. """
+    regressoes = []
+    for nome, resultado in resultados.items():
+        if nome not in base:
+            continue
+        lentidao = base[nome]["ticks_por_segundo"] / resultado["ticks_por_segundo"] - 1
+        if lentidao > limite:
+            regressoes.append((nome, lentidao))
+    return regressoes
+
+
+def _imprimir_cenarios(resultados, base=None):
+    for nome, resultado in resultados.items():
+        linha = f"{nome:<14}{resultado['ticks_por_segundo']:>10.0f} ticks/s"
+        if base and nome in base:
+            lentidao = base[nome]["ticks_por_segundo"] / resultado["ticks_por_segundo"] - 1
+            linha += f"  (tempo por tick {lentidao:+.0%} vs base)"
+        print(linha)
+        for fase, ms in resultado["ms_por_fase"].items():
+            print(f"    {fase:<12}{ms:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmarks de desempenho")
+    parser.add_argument("comando", nargs="?", default="memoria", choices=["memoria", "cenarios"])
+    parser.add_argument("--cenario", action="append", choices=list(CENARIOS), help="Só estes cenários")
+    parser.add_argument("--ticks", type=int, default=600)
+    parser.add_argument("--salvar", help="Grava os resultados como nova base (JSON)")
+    parser.add_argument("--comparar", help="Base (JSON) para comparar; falha se ficar mais lento que o limite")
+    parser.add_argument("--limite", type=float, default=0.15, help="Lentidão tolerada (0.15 = 15%%)")
+    args = parser.parse_args()
+
+    pygame.init()
+
+    if args.comando == "memoria":
+        _imprimir_memoria()
+        sys.exit(0)
+
+    resultados = rodar_cenarios(args.cenario, args.ticks)
+
+    base = None
+    if args.comparar:
+        with open(args.comparar) as arquivo:
+            base = json.load(arquivo)
+
+    _imprimir_cenarios(resultados, base)
+
+    if args.salvar:
+        with open(args.salvar, "w") as arquivo:
+            json.dump(resultados, arquivo, indent=2)
+        print(f"Base salva em {args.salvar}")
+
+    if base is not None:
+        regressoes = comparar(resultados, base, args.limite)
+        for nome, lentidao in regressoes:
+            print(f"REGRESSÃO: {nome} ficou {lentidao:.0%} mais lento (limite {args.limite:.0%})")
+        if regressoes:
+            sys.exit(1)
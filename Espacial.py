@@ -0,0 +1,120 @@
+# scripts/Espacial.py
+
+from bisect import bisect_left, bisect_right
+from operator import attrgetter
+
+import numpy as np
+
+
+class IndiceLinhas:
+    """ Índice espacial dos inimigos: uma lista por linha do grid, ordenada pelo x. """
+
+    def __init__(self, num_linhas):
+        self.num_linhas = num_linhas
+        self.linhas = [[] for _ in range(num_linhas)]
+        # Chaves de ordenação (inimigo.x) paralelas a self.linhas, para o bisect
+        self.xs = [[] for _ in range(num_linhas)]
+        # Maior largura de imagem vista (usada para achar sobreposições pelo x da esquerda)
+        self.largura_max = 0
+        # self.xs como array NumPy, por linha (cache até a linha mudar)
+        self._xs_array = [None] * num_linhas
+        # Linhas que ganharam inimigo desde o último consumir_entradas()
+        self._linhas_com_entrada = set()
+
+    def inserir(self, inimigo):
+        """ Adiciona o inimigo na linha dele, mantendo a ordem por x. """
+        linha = self.linhas[inimigo.row]
+        xs = self.xs[inimigo.row]
+
+        x = inimigo.x
+        i = bisect_right(xs, x)
+        linha.insert(i, inimigo)
+        xs.insert(i, x)
+        self._xs_array[inimigo.row] = None
+        self._linhas_com_entrada.add(inimigo.row)
+
+        self.largura_max = max(self.largura_max, inimigo.img.get_width())
+
+    def remover(self, inimigo):
+        """ Remove o inimigo do índice (não faz nada se ele não estiver lá). """
+        linha = self.linhas[inimigo.row]
+        xs = self.xs[inimigo.row]
+
+        # A chave guardada é a do último reordenar(); como o inimigo só anda
+        # para a esquerda, ela é >= inimigo.x atual, então basta procurar para frente
+        i = bisect_left(xs, inimigo.x)
+        while i < len(linha):
+            if linha[i] is inimigo:
+                del linha[i]
+                del xs[i]
+                self._xs_array[inimigo.row] = None
+                return
+            i += 1
+
+    def remover_varios(self, inimigos):
+        """ Remove vários inimigos (já marcados com removido=True) numa passada
+        por linha afetada, em vez de um del por inimigo. """
+        if not inimigos:
+            return
+        if len(inimigos) == 1:
+            self.remover(inimigos[0])
+            return
+
+        for row in {inimigo.row for inimigo in inimigos}:
+            linha = [inimigo for inimigo in self.linhas[row] if not inimigo.removido]
+            self.linhas[row] = linha
+            self.xs[row] = [inimigo.x for inimigo in linha]
+            self._xs_array[row] = None
+
+    def reordenar(self):
+        """ Reordena as linhas depois do movimento (uma vez por tick). """
+        for row in range(self.num_linhas):
+            linha = self.linhas[row]
+            if not linha:
+                continue
+            # Inimigos quase nunca trocam de ordem, então o sort é praticamente linear
+            linha.sort(key=attrgetter("x"))
+            self.xs[row] = [inimigo.x for inimigo in linha]
+            self._xs_array[row] = None
+
+    def xs_array(self, row):
+        """ As chaves x da linha como array NumPy (para buscas vetorizadas). """
+        xs = self._xs_array[row]
+        if xs is None:
+            xs = np.array(self.xs[row], dtype=np.float64)
+            self._xs_array[row] = xs
+        return xs
+
+    def consumir_entradas(self):
+        """ Linhas (em ordem) que ganharam inimigo desde a última chamada.
+
+        Inimigos só andam para a esquerda, então só uma entrada nova pode
+        colocar um inimigo à direita de quem antes não tinha nenhum.
+        """
+        linhas = sorted(self._linhas_com_entrada)
+        self._linhas_com_entrada.clear()
+        return linhas
+
+    def existe_a_direita(self, row, x):
+        """ True se existe algum inimigo na linha com inimigo.x maior que x. O(1). """
+        xs = self.xs[row]
+        return bool(xs) and xs[-1] > x
+
+    def no_intervalo(self, row, x_min, x_max):
+        """ Inimigos da linha cujo rect() de colisão cruza o intervalo [x_min, x_max). """
+        if row < 0 or row >= self.num_linhas:
+            return []
+
+        linha = self.linhas[row]
+        xs = self.xs[row]
+
+        inicio = bisect_right(xs, x_min - self.largura_max)
+        fim = bisect_left(xs, x_max)
+
+        encontrados = []
+        for i in range(inicio, fim):
+            inimigo = linha[i]
+            r = inimigo.rect()
+            if r.right > x_min and r.left < x_max:
+                encontrados.append(inimigo)
+        return encontrados
@@ -0,0 +1,82 @@
+# scripts/Grade.py
+
+
+class GeometriaGrade:
+    """ Posições do grid calculadas uma vez só, em tabelas planas.
+
+    Índice das tabelas por célula: row * colunas + col. A conversão
+    pixel -> célula também é uma consulta de tabela (um item por pixel).
+
+    O objeto não muda: outro tamanho de grid é outra geometria (de outra
+    Simulation). Quem guarda algo calculado a partir da geometria pode comparar
+    a identidade (sim.geometria is geometria) para saber se o grid mudou.
+    """
+
+    def __init__(self, linhas, colunas, largura_celula, altura_celula, x0, y0):
+        self.linhas = linhas
+        self.colunas = colunas
+        self.largura_celula = largura_celula
+        self.altura_celula = altura_celula
+        self.x0 = x0
+        self.y0 = y0
+
+        # Bordas do grid (a direita e a de baixo já ficam fora)
+        self.x_fim = x0 + colunas * largura_celula
+        self.y_fim = y0 + linhas * altura_celula
+
+        # Borda esquerda de cada coluna e faixa (y_topo, y_base) de cada linha
+        self.xs_colunas = [x0 + col * largura_celula for col in range(colunas)]
+        self.faixas_linhas = [(y0 + row * altura_celula, y0 + (row + 1) * altura_celula) for row in range(linhas)]
+
+        # Por célula: centro e retângulo (x, y, largura, altura)
+        self.centros = []
+        self.retangulos = []
+        for topo, _ in self.faixas_linhas:
+            for x in self.xs_colunas:
+                self.centros.append((x + largura_celula // 2, topo + altura_celula // 2))
+                self.retangulos.append((x, topo, largura_celula, altura_celula))
+
+        # Pixel -> coluna/linha. A tabela das colunas começa uma célula antes do grid:
+        # um inimigo que já passou da primeira coluna ainda pode encostar nela
+        self._x_tabela = x0 - largura_celula
+        self._coluna_do_x = [(x - x0) // largura_celula for x in range(self._x_tabela, self.x_fim)]
+        self._linha_do_y = [(y - y0) // altura_celula for y in range(y0, self.y_fim)]
+
+        # Tamanho do sprite -> canto superior esquerdo dele centrado em cada célula
+        self._ancoras = {}
+
+    # ===================================================
+    # CONSULTAS
+    # ===================================================
+    def centro(self, row, col):
+        return self.centros[row * self.colunas + col]
+
+    def retangulo(self, row, col):
+        return self.retangulos[row * self.colunas + col]
+
+    def coluna_do_x(self, x):
+        """ Coluna que contém o pixel x (inteiro). Pode sair de 0..colunas-1 fora do grid. """
+        i = x - self._x_tabela
+        if 0 <= i < len(self._coluna_do_x):
+            return self._coluna_do_x[i]
+        return (x - self.x0) // self.largura_celula
+
+    def celula(self, pos):
+        """ (row, col) da célula sob o pixel pos, ou (None, None) fora do grid. """
+        x, y = int(pos[0]), int(pos[1])
+        if x < self.x0 or x >= self.x_fim or y < self.y0 or y >= self.y_fim:
+            return None, None
+        return self._linha_do_y[y - self.y0], self._coluna_do_x[x - self._x_tabela]
+
+    def posicao_sprite(self, tamanho, row, col):
+        """ Canto superior esquerdo de um sprite de `tamanho` (largura, altura) centrado na célula.
+
+        Uma tabela por tamanho de sprite (na prática, uma por tipo de torre/inimigo),
+        montada no primeiro pedido.
+        """
+        tabela = self._ancoras.get(tamanho)
+        if tabela is None:
+            meia_largura, meia_altura = tamanho[0] // 2, tamanho[1] // 2
+            tabela = [(cx - meia_largura, cy - meia_altura) for cx, cy in self.centros]
+            self._ancoras[tamanho] = tabela
+        return tabela[row * self.colunas + col]
@@ -0,0 +1,71 @@
+# scripts/Hud.py
+
+import pygame
+
+
+class TextoHud:
+    """ Um texto do HUD que só é renderizado de novo quando o valor muda. """
+
+    def __init__(self, font, formato, cor, pos):
+        self.font = font
+        self.formato = formato
+        self.cor = cor
+        self.pos = pos
+
+        self.valor = None
+        self.surface = None
+
+    def draw(self, display, valor):
+        if self.surface is None or valor != self.valor:
+            self.valor = valor
+            self.surface = self.font.render(self.formato.format(valor), True, self.cor)
+        display.blit(self.surface, self.pos)
+
+
+class Hud:
+    """ Contadores e instruções da tela. Fontes carregadas uma vez só. """
+
+    INSTRUCOES = [
+        "Botao Direito: Peashooter (100)",
+        "Botao Meio: Noz (50)",
+        "Tecla G: Girassol (50)",
+        "Tecla C: Cereja-Bomba (150)"
+    ]
+
+    def __init__(self):
+        self.font = pygame.font.Font(None, 30)
+        self.info_font = pygame.font.Font(None, 20)
+
+        self.energia = TextoHud(self.font, "Energia: {}", (255, 255, 0), (50, 20))
+        self.torres = TextoHud(self.font, "Torres: {}", (100, 255, 255), (50, 50))
+        self.inimigos = TextoHud(self.font, "Inimigos: {}", (255, 100, 100), (50, 80))
+
+        self.instrucoes = self._render_instrucoes()
+
+    def _render_instrucoes(self):
+        """ Renderiza o bloco fixo de instruções numa única Surface transparente. """
+        linhas = [self.info_font.render(texto, True, (200, 200, 200)) for texto in self.INSTRUCOES]
+
+        largura = max(linha.get_width() for linha in linhas)
+        altura = (len(linhas) - 1) * 25 + linhas[-1].get_height()
+
+        bloco = pygame.Surface((largura, altura), pygame.SRCALPHA)
+        for i, linha in enumerate(linhas):
+            bloco.blit(linha, (0, i * 25))
+        return bloco
+
+    def retangulos(self):
+        """ Áreas do HUD. Entram todas, porque o texto com antialias não pode
+        ser desenhado duas vezes em cima dele mesmo sem apagar antes. """
+        retangulos = [texto.surface.get_rect(topleft=texto.pos)
+                      for texto in (self.energia, self.torres, self.inimigos) if texto.surface is not None]
+        retangulos.append(self.instrucoes.get_rect(topleft=(500, 20)))
+        return retangulos
+
+    def draw(self, display, sim):
+        self.energia.draw(display, sim.total_energia)
+        self.torres.draw(display, len(sim.torres))
+        self.inimigos.draw(display, len(sim.inimigos))
+
+        # INSTRUÇÕES
+        display.blit(self.instrucoes, (500, 20))
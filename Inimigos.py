@@ -4,22 +4,34 @@ import pygame
 import random
 import math
 from .Torres import TorreBase
+from .Mecanicas import interpolar
+from .Registro import log
 
 class Inimigo:
     """Classe para inimigos que atacam as torres."""
 
-    def __init__(self, jogo, tipo, pos, vida=10, velocidade=0.007, dano=1): 
+    __slots__ = (
+        "jogo", "tipo", "x", "y", "row", "x_anterior", "y_anterior", "img",
+        "velocidade_base", "velocidade_atual", "movendo", "vida", "vida_maxima",
+        "dano_ataque", "cooldown_ataque_max", "cooldown_ataque_atual", "_rect", "removido",
+    )
+
+    def __init__(self, jogo, tipo, pos, vida=10, velocidade=0.007, dano=1, row=None): 
         self.jogo = jogo
         self.tipo = tipo
-        self.pos = list(pos)
-        
-        # Carrega a imagem do inimigo
-        try:
-            self.img = jogo.assets["inimigo"][tipo]
-        except KeyError:
-            print(f"ERRO: Asset 'inimigo' do tipo '{tipo}' não encontrado. Usando placeholder.")
-            self.img = pygame.Surface((40, 40))
-            self.img.fill((255, 0, 0))  # Vermelho para inimigos
+        self.x = float(pos[0])
+        self.y = float(pos[1])
+        self.row = row  # Linha do grid (usada pelo índice espacial)
+        self.removido = False  # Marcado quando sai do jogo (compactação em lote)
+        # Posição no tick anterior (interpolação)
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+        
+        # Imagem do inimigo (placeholder vermelho se o asset faltar)
+        self.img = jogo.assets.imagem("inimigo", tipo)
+        
+        # Rect de colisão (imagem com 5px a menos de cada lado), atualizado no lugar ao andar
+        self._rect = self.img.get_rect(topleft=(self.x, self.y)).inflate(-10, -10)
              
         self.velocidade_base = velocidade
         self.velocidade_atual = velocidade
@@ -32,33 +44,62 @@ class Inimigo:
         self.cooldown_ataque_max = 60
         self.cooldown_ataque_atual = 0 
         
+    @property
+    def pos(self):
+        """Posição (x, y) do canto superior esquerdo."""
+        return (self.x, self.y)
+        
+    def pos_desenho(self, alpha=1.0):
+        """Posição de desenho interpolada entre o tick anterior e o atual."""
+        return interpolar(self.x_anterior, self.y_anterior, self.x, self.y, alpha)
+        
     def rect(self):
-        """Retorna o retângulo de colisão do inimigo."""
-        return self.img.get_rect(topleft=self.pos).inflate(-10, -10) 
+        """Retorna o retângulo de colisão do inimigo (o mesmo objeto sempre; não modificar)."""
+        return self._rect
         
     def receber_dano(self, dano):
         """Aplica dano ao inimigo e retorna True se morreu."""
         self.vida -= dano
         return self.vida <= 0
         
+    def torre_em_contato(self):
+        """Retorna a torre que o inimigo está tocando, ou None.
+
+        Usa o grid em vez de percorrer jogo.torres: só a célula da borda da frente
+        (esquerda) do inimigo e a seguinte podem ter uma torre encostada nele.
+        """
+        jogo = self.jogo
+        meu_rect = self.rect()
+        
+        geometria = jogo.geometria
+        col_frente = geometria.coluna_do_x(meu_rect.left)
+        
+        for col in (col_frente, col_frente + 1):
+            if 0 <= col < geometria.colunas:
+                torre = jogo.grid[self.row][col]
+                if torre is not None and meu_rect.colliderect(torre.rect()):
+                    return torre
+        
+        return None
+        
     def update(self):
         """Atualiza o estado do inimigo (movimento, colisão, ataque)."""
         
         self.movendo = True
+        self.x_anterior = self.x
+        self.y_anterior = self.y
         
         # 1. Lógica de Colisão com Torres
         colidiu_com_torre = False
-        for torre in self.jogo.torres:
-            if self.rect().colliderect(torre.rect()):
-                self.movendo = False
-                colidiu_com_torre = True
-                
-                # Lógica de Cooldown de Ataque
-                if self.cooldown_ataque_atual <= 0:
-                    torre.receber_dano(self.dano_ataque)  # Aplica 1 de dano
-                    self.cooldown_ataque_atual = self.cooldown_ataque_max
-                    
-                break
+        torre = self.torre_em_contato()
+        if torre is not None:
+            self.movendo = False
+            colidiu_com_torre = True
+            
+            # Lógica de Cooldown de Ataque
+            if self.cooldown_ataque_atual <= 0:
+                torre.receber_dano(self.dano_ataque)  # Aplica 1 de dano
+                self.cooldown_ataque_atual = self.cooldown_ataque_max
         
         # Atualiza o cooldown se colidiu, mas não ataca se for 0
         if colidiu_com_torre and self.cooldown_ataque_atual > 0:
@@ -66,28 +107,34 @@ class Inimigo:
 
         # 2. Movimento
         if self.movendo:
-            self.pos[0] -= self.velocidade_atual
+            self.x -= self.velocidade_atual
+            # Mesmo arredondamento do get_rect(topleft=...) seguido do inflate(-10, -10)
+            self._rect.x = self.x
+            self._rect.x += 5
             
         # 3. Condição de Morte ou Game Over
         if self.vida <= 0:
             return True 
-        if self.pos[0] < -50:
-            print("Inimigo atravessou! Game Over ou perda de vida do jogador.")
+        if self.x < -50:
+            self.jogo.contadores["inimigos_vazados"] += 1
+            log.info("Inimigo atravessou! Game Over ou perda de vida do jogador.")
             return True  # Remove o inimigo que passou
             
         return False
     
-    def draw(self, display):
-        """Desenha o inimigo e sua barra de vida na tela."""
+    def draw(self, display, alpha=1.0):
+        """Desenha o inimigo e sua barra de vida na tela (alpha: interpolação entre ticks)."""
+        x, y = self.pos_desenho(alpha)
+        
         # Desenha a imagem do inimigo
-        display.blit(self.img, (int(self.pos[0]), int(self.pos[1])))
+        display.blit(self.img, (x, y))
         
         # Desenha a barra de vida
         if self.vida < self.vida_maxima:  # Só mostra se tiver dano
             barra_largura = 40
             barra_altura = 5
-            barra_x = int(self.pos[0])
-            barra_y = int(self.pos[1]) - 10
+            barra_x = x
+            barra_y = y - 10
             
             # Fundo da barra (vermelho)
             pygame.draw.rect(display, (255, 0, 0), 
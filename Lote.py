@@ -0,0 +1,234 @@
+# Partidas em lote para balanceamento (sem janela, em paralelo em todos os núcleos)
+#
+#   python -m scripts.Lote --param Peashooter.CUSTO_ENERGIA=75,100,125 \
+#       --param Simulation.VELOCIDADE_INIMIGO=0.1:0.4,0.2:0.5 --sementes 20 --saida lote.csv
+#
+# Cada --param é Classe.ATRIBUTO=valor1,valor2,...; "a:b" vira a tupla (a, b).
+# Roda todas as combinações x sementes e grava uma linha por partida no CSV
+# (uma coluna por métrica) assim que cada partida termina.
+
+import argparse
+import csv
+import itertools
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# Sem janela: o SDL usa o driver de vídeo "dummy"
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from scripts.Simulacao import Simulation
+from scripts.Torres import Peashooter, NozObstaculo, Girassol, CerejaBomba
+
+# Classes cujos atributos podem ser variados com --param
+ALVOS = {classe.__name__: classe for classe in (Simulation, Peashooter, NozObstaculo, Girassol, CerejaBomba)}
+
+
+# ===================================================
+# POLÍTICAS DE PLANTIO (o "jogador" das partidas)
+# ===================================================
+def _coletar_tudo(sim):
+    for energia_obj in list(sim.energias_caindo):
+        sim.coletar_energia(energia_obj.rect().center)
+
+
+def _livre(sim, row, colunas):
+    for col in colunas:
+        if sim.grid[row][col] is None:
+            return col
+    return None
+
+
+def _linhas_ameacadas(sim):
+    """ Linhas com inimigos, da mais perigosa (inimigo mais à esquerda) para a menos. """
+    linhas = [(sim.indice_inimigos.xs[row][0], row) for row in range(sim.GRID_ROWS) if sim.indice_inimigos.xs[row]]
+    return [row for _, row in sorted(linhas)]
+
+
+def _defender(sim, colunas):
+    """ Planta um Peashooter na linha mais ameaçada que ainda tenha espaço. """
+    for row in _linhas_ameacadas(sim):
+        col = _livre(sim, row, colunas)
+        if col is not None and sim.total_energia >= Peashooter.CUSTO_ENERGIA:
+            sim.colocar_torre(Peashooter, row, col)
+            return
+
+
+def politica_girassol_primeiro(sim):
+    """ Uma coluna de Girassóis, mas sem deixar linha com inimigo e sem Peashooter. """
+    _coletar_tudo(sim)
+
+    for row in _linhas_ameacadas(sim):
+        if not any(isinstance(torre, Peashooter) for torre in sim.grid[row]):
+            if sim.total_energia >= Peashooter.CUSTO_ENERGIA:
+                sim.colocar_torre(Peashooter, row, _livre(sim, row, range(1, 5)))
+            return
+
+    for row in range(sim.GRID_ROWS):
+        if sim.grid[row][0] is None:
+            if sim.total_energia >= Girassol.CUSTO_ENERGIA:
+                sim.colocar_torre(Girassol, row, 0)
+            return
+
+    _defender(sim, range(1, 5))
+
+
+def politica_so_peashooter(sim):
+    """ Nada de economia: só Peashooters, onde houver inimigos. """
+    _coletar_tudo(sim)
+    _defender(sim, range(0, 5))
+
+
+POLITICAS = {
+    "girassol_primeiro": politica_girassol_primeiro,
+    "so_peashooter": politica_so_peashooter,
+}
+
+
+# ===================================================
+# UMA PARTIDA
+# ===================================================
+def rodar_partida(parametros, semente, politica="girassol_primeiro", ticks=18000, vazamentos_max=1,
+                  intervalo_politica=20, amostra_energia=1800):
+    """ Joga uma partida com os parâmetros dados. Roda no processo filho.
+
+    A partida acaba em `ticks` ou quando `vazamentos_max` inimigos atravessarem.
+    """
+    originais = {}
+    try:
+        for nome, valor in parametros.items():
+            classe, atributo = nome.split(".")
+            originais[nome] = getattr(ALVOS[classe], atributo)
+            setattr(ALVOS[classe], atributo, valor)
+
+        sim = Simulation(semente=semente)
+        jogar = POLITICAS[politica]
+        curva = []
+
+        while sim.tick < ticks and sim.contadores["inimigos_vazados"] < vazamentos_max:
+            if sim.tick % intervalo_politica == 0:
+                jogar(sim)
+            if sim.tick % amostra_energia == 0:
+                curva.append(sim.total_energia)
+            sim.step(1)
+    finally:
+        for nome, valor in originais.items():
+            classe, atributo = nome.split(".")
+            setattr(ALVOS[classe], atributo, valor)
+
+    contadores = sim.contadores
+    resultado = {
+        "semente": semente,
+        "ticks_sobrevivencia": sim.tick,
+        "vazamentos": contadores["inimigos_vazados"],
+        "mortes": contadores["inimigos_mortos"] + contadores["inimigos_explodidos"],
+        "sois": contadores["sois_produzidos"],
+        "torres_plantadas": contadores["torres_plantadas"],
+        "energia_final": sim.total_energia,
+    }
+    for i in range(ticks // amostra_energia):
+        resultado[f"energia_t{i * amostra_energia}"] = curva[i] if i < len(curva) else ""
+    return resultado
+
+
+# ===================================================
+# LOTE
+# ===================================================
+def _valor(texto):
+    if ":" in texto:
+        return tuple(_valor(parte) for parte in texto.split(":"))
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def ler_parametros(especificacoes):
+    """ ["Classe.ATRIBUTO=v1,v2", ...] -> {"Classe.ATRIBUTO": [v1, v2], ...} """
+    grade = {}
+    for especificacao in especificacoes:
+        nome, valores = especificacao.split("=", 1)
+        classe, atributo = nome.split(".")
+        if classe not in ALVOS or not hasattr(ALVOS[classe], atributo):
+            raise ValueError(f"Parâmetro desconhecido: {nome}")
+        if isinstance(getattr(ALVOS[classe], atributo), property):
+            # Ex.: Simulation.GRID_COLS (o tamanho do grid é fixado ao criar a Simulation)
+            raise ValueError(f"{nome} não é um parâmetro de balanceamento")
+        grade[nome] = [_valor(valor) for valor in valores.split(",")]
+    return grade
+
+
+def rodar_lote(grade, sementes, saida, processos=None, **opcoes):
+    """ Roda todas as combinações da grade com cada semente; devolve os resultados por combinação. """
+    nomes = list(grade)
+    combinacoes = [dict(zip(nomes, valores)) for valores in itertools.product(*grade.values())]
+
+    ticks = opcoes.get("ticks", 18000)
+    amostra = opcoes.get("amostra_energia", 1800)
+    colunas = (["combinacao"] + nomes + ["semente", "ticks_sobrevivencia", "vazamentos", "mortes", "sois",
+               "torres_plantadas", "energia_final"] + [f"energia_t{i * amostra}" for i in range(ticks // amostra)])
+
+    por_combinacao = {i: [] for i in range(len(combinacoes))}
+    total = len(combinacoes) * len(sementes)
+    inicio = time.perf_counter()
+
+    with open(saida, "w", newline="") as arquivo, ProcessPoolExecutor(max_workers=processos) as executor:
+        escritor = csv.DictWriter(arquivo, fieldnames=colunas)
+        escritor.writeheader()
+
+        futuros = {}
+        for i, parametros in enumerate(combinacoes):
+            for semente in sementes:
+                futuros[executor.submit(rodar_partida, parametros, semente, **opcoes)] = i
+
+        for feitos, futuro in enumerate(as_completed(futuros), start=1):
+            i = futuros[futuro]
+            resultado = futuro.result()
+            por_combinacao[i].append(resultado)
+
+            escritor.writerow({"combinacao": i, **combinacoes[i], **resultado})
+            arquivo.flush()
+            print(f"\r{feitos}/{total} partidas ({time.perf_counter() - inicio:.0f} s)", end="", flush=True)
+    print()
+
+    return combinacoes, por_combinacao
+
+
+def _imprimir_resumo(combinacoes, por_combinacao):
+    print(f"{'#':>3}  {'sobrevivência':>13}{'vazamentos':>11}{'mortes':>8}{'energia':>9}  parâmetros")
+    medias = []
+    for i, parametros in enumerate(combinacoes):
+        resultados = por_combinacao[i]
+        media = lambda campo: statistics.fmean(r[campo] for r in resultados)
+        medias.append((media("ticks_sobrevivencia"), i, media("vazamentos"), media("mortes"), media("energia_final")))
+
+    for sobrevivencia, i, vazamentos, mortes, energia in sorted(medias, reverse=True):
+        parametros = " ".join(f"{nome}={valor}" for nome, valor in combinacoes[i].items())
+        print(f"{i:>3}  {sobrevivencia:>13.0f}{vazamentos:>11.2f}{mortes:>8.1f}{energia:>9.0f}  {parametros}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Partidas em lote para balanceamento")
+    parser.add_argument("--param", action="append", default=[], help="Classe.ATRIBUTO=v1,v2 (a:b = tupla)")
+    parser.add_argument("--sementes", type=int, default=10, help="Partidas por combinação")
+    parser.add_argument("--politica", choices=list(POLITICAS), default="girassol_primeiro")
+    parser.add_argument("--ticks", type=int, default=18000, help="Duração máxima de cada partida")
+    parser.add_argument("--vazamentos", type=int, default=1, help="Inimigos que passam até a partida acabar")
+    parser.add_argument("--processos", type=int, default=None, help="Padrão: todos os núcleos")
+    parser.add_argument("--saida", default="lote.csv")
+    args = parser.parse_args()
+
+    try:
+        grade = ler_parametros(args.param)
+    except ValueError as erro:
+        print(erro)
+        sys.exit(2)
+
+    combinacoes, por_combinacao = rodar_lote(
+        grade, range(args.sementes), args.saida, args.processos,
+        politica=args.politica, ticks=args.ticks, vazamentos_max=args.vazamentos,
+    )
+    _imprimir_resumo(combinacoes, por_combinacao)
+    print(f"Resultados por partida em {args.saida}")
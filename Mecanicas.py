@@ -1,52 +1,199 @@
-import pygame, math, random
+import pygame
+import numpy as np
 
-class projetil:
 
-    def __init__(self, jogo, tipo, pos, velocidade=[0, 0], dano=1):
-        self.jogo = jogo
-        self.tipo = tipo
-        self.pos = list(pos)
-        self.velocidade = list(velocidade)
-        self.dano = dano
-        self.img = jogo.assets["projetil"][tipo]
-        # Período de graça de 3 frames antes de poder colidir
-        self.vida_util = 3 
+def interpolar(x_anterior, y_anterior, x, y, alpha):
+    """ Posição de desenho entre o tick anterior e o atual (alpha de 0 a 1). """
+    return (int(x_anterior + (x - x_anterior) * alpha),
+            int(y_anterior + (y - y_anterior) * alpha))
+
+
+# ===================================================
+# PROJÉTEIS (arrays NumPy por linha do grid)
+# ===================================================
+class _FaixaProjeteis:
+    """ Projéteis de uma linha do grid. Os vivos ocupam as posições [0, n). """
+    
+    def __init__(self, capacidade):
+        self.n = 0
+        self._alocar(capacidade)
         
-    def rect(self):
-        return pygame.Rect(self.pos, self.img.get_size())
+    def _alocar(self, capacidade):
+        self.capacidade = capacidade
+        self.x = np.zeros(capacidade, dtype=np.float64)
+        self.x_anterior = np.zeros(capacidade, dtype=np.float64)  # Interpolação
+        self.y = np.zeros(capacidade, dtype=np.float64)
+        self.vx = np.zeros(capacidade, dtype=np.float64)
+        self.dano = np.zeros(capacidade, dtype=np.float64)
+        self.graca = np.zeros(capacidade, dtype=np.int32)  # Ticks até poder colidir
+        
+    def _arrays(self):
+        return (self.x, self.x_anterior, self.y, self.vx, self.dano, self.graca)
+        
+    def adicionar(self, x, y, vx, dano, graca):
+        if self.n == self.capacidade:
+            antigos = self._arrays()
+            self._alocar(self.capacidade * 2)
+            for antigo, novo in zip(antigos, self._arrays()):
+                novo[:self.n] = antigo[:self.n]
+        
+        i = self.n
+        self.x[i] = x
+        self.x_anterior[i] = x
+        self.y[i] = y
+        self.vx[i] = vx
+        self.dano[i] = dano
+        self.graca[i] = graca
+        self.n += 1
+        
+    def manter(self, mascara):
+        """ Mantém só os projéteis marcados e compacta os arrays. """
+        total = int(np.count_nonzero(mascara))
+        if total < self.n:
+            for arr in self._arrays():
+                arr[:total] = arr[:self.n][mascara]
+            self.n = total
+
+
+class SistemaProjeteis:
+    """ Todos os projéteis do jogo, separados por linha do grid.
     
-    def update(self):
-        # Decrementa o período de graça
-        if self.vida_util > 0:
-            self.vida_util -= 1
+    Projéteis só andam em x dentro da própria linha, então cada linha é movida
+    de uma vez com NumPy, e os candidatos a colisão são achados com busca
+    binária no x (ordenado) dos inimigos da mesma linha.
+    """
+    
+    GRACA = 3  # Período de graça de 3 ticks antes de poder colidir
+    
+    def __init__(self, img, num_linhas, limite_x=850, capacidade=64):
+        self.img = img
+        self.limite_x = limite_x  # Passou daqui (à direita da tela e do grid), o projétil some
+        self.largura, self.altura = img.get_size()
+        self._rect_teste = pygame.Rect(0, 0, self.largura, self.altura)  # Reaproveitado nos testes de colisão
+        self.faixas = [_FaixaProjeteis(capacidade) for _ in range(num_linhas)]
+        
+    def __len__(self):
+        return sum(faixa.n for faixa in self.faixas)
+        
+    def estado(self):
+        """ Todos os projéteis numa matriz float64 (linha do grid + os arrays da faixa), para o Snapshot. """
+        blocos = [np.column_stack([np.full(faixa.n, row, dtype=np.float64)] + [arr[:faixa.n] for arr in faixa._arrays()])
+                  for row, faixa in enumerate(self.faixas)]
+        return np.concatenate(blocos)
+        
+    def carregar_estado(self, tabela):
+        """ Substitui os projéteis pelos de uma matriz gerada por estado(). """
+        for row, faixa in enumerate(self.faixas):
+            linhas = tabela[tabela[:, 0] == row]
+            n = len(linhas)
+            if n > faixa.capacidade:
+                faixa._alocar(n)
+            for j, arr in enumerate(faixa._arrays()):
+                arr[:n] = linhas[:, j + 1]
+            faixa.n = n
+        
+    def disparar(self, row, pos, velocidade_x=5, dano=1):
+        """ Cria um projétil na linha row, na posição (canto superior esquerdo) pos. """
+        self.faixas[row].adicionar(pos[0], pos[1], velocidade_x, dano, self.GRACA)
+        
+    def atualizar(self, indice_inimigos):
+        """ Move todos os projéteis e resolve as colisões.
+        
+        Retorna uma lista de acertos (inimigo, dano, centro do projétil); quem
+        acertou ou saiu da tela já foi removido.
+        """
+        acertos = []
+        
+        for row, faixa in enumerate(self.faixas):
+            n = faixa.n
+            if n == 0:
+                continue
+            
+            graca = faixa.graca[:n]
+            np.subtract(graca, 1, out=graca, where=graca > 0)
+            
+            x = faixa.x[:n]
+            faixa.x_anterior[:n] = x
+            x += faixa.vx[:n]
+            
+            remover = x > self.limite_x
             
-        self.pos[0] += self.velocidade[0]
-        self.pos[1] += self.velocidade[1]
+            prontos = np.flatnonzero(graca <= 0)
+            inimigos = indice_inimigos.linhas[row]
+            
+            if len(prontos) > 0 and inimigos:
+                xs_inimigos = indice_inimigos.xs_array(row)
+                px = x[prontos]
+                
+                # Inimigos que podem cruzar [px, px + largura): inimigo.x nessa faixa
+                inicio = np.searchsorted(xs_inimigos, px - indice_inimigos.largura_max - 1, side="right")
+                fim = np.searchsorted(xs_inimigos, px + self.largura, side="left")
+                
+                # Só os projéteis com algum candidato passam pelo teste exato
+                proj_rect = self._rect_teste
+                for k in np.flatnonzero(fim > inicio).tolist():
+                    i = prontos[k]
+                    # Mesmo arredondamento do pygame.Rect(pos, tamanho) (trunca)
+                    proj_rect.x = int(faixa.x[i])
+                    proj_rect.y = int(faixa.y[i])
+                    
+                    for j in range(inicio[k], fim[k]):
+                        if proj_rect.colliderect(inimigos[j].rect()):
+                            acertos.append((inimigos[j], float(faixa.dano[i]), proj_rect.center))
+                            remover[i] = True
+                            break
+            
+            faixa.manter(~remover)
+        
+        return acertos
+        
+    def _posicoes_desenho(self, faixa, alpha):
+        n = faixa.n
+        xs = faixa.x_anterior[:n] + (faixa.x[:n] - faixa.x_anterior[:n]) * alpha
+        return zip(xs.astype(np.int32).tolist(), faixa.y[:n].astype(np.int32).tolist())
         
-    def draw(self, display):
-        display.blit(self.img, (int(self.pos[0]), int(self.pos[1])))
+    def retangulos(self, alpha=1.0):
+        """ Retângulos (x, y, w, h) dos projéteis (para dirty rects). """
+        retangulos = []
+        for faixa in self.faixas:
+            retangulos.extend((x, y, self.largura, self.altura) for x, y in self._posicoes_desenho(faixa, alpha))
+        return retangulos
         
-    def pode_colidir(self):
-        """Verifica se o projétil já pode colidir (após o grace period)."""
-        return self.vida_util <= 0
+    def draw(self, display, alpha=1.0):
+        img = self.img
+        for faixa in self.faixas:
+            if faixa.n:
+                display.blits([(img, pos) for pos in self._posicoes_desenho(faixa, alpha)], doreturn=False)
 
 # ===================================================
 # CLASSE ENERGIA (Com efeito de "pulinho")
 # ===================================================
 class Energia:
     
+    __slots__ = (
+        "x", "y", "x_anterior", "y_anterior", "vx", "vy", "valor", "vida_maxima", "vida",
+        "onda", "img", "tempo_parada_max", "tempo_parada_atual", "usa_gravidade", "gravidade",
+        "y_parada", "x_parada", "_rect", "expira_em", "_evento",
+    )
+    
     def __init__ (self, jogo, pos, velocidade=[0, 0], valor=25, vida=480, onda=True):
         
-        self.jogo = jogo
-        self.pos = list(pos)
-        self.velocidade = list(velocidade)
+        # 'jogo' só é usado aqui (asset e limites do grid); a energia não guarda referência
+        self.x = float(pos[0])
+        self.y = float(pos[1])
+        # Posição no tick anterior (interpolação)
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+        self.vx = float(velocidade[0])
+        self.vy = float(velocidade[1])
         self.valor = valor
         
         self.vida_maxima = vida
         self.vida = vida 
         
         self.onda = onda 
-        self.img = jogo.assets["Energia"]
+        self.img = jogo.assets.imagem("energia", "energia")
+        self._rect = pygame.Rect((self.x, self.y), self.img.get_size())
         
         self.tempo_parada_max = 60 
         self.tempo_parada_atual = 0
@@ -55,74 +202,276 @@ class Energia:
         self.usa_gravidade = (velocidade[1] < 0)  # Se começa subindo, usa gravidade
         self.gravidade = 0.15 if self.usa_gravidade else 0  # Aceleração da gravidade
 
-        y_min = jogo.GRID_OFFSET_Y + jogo.CELL_HEIGHT * 0.5 
-        y_max = jogo.GRID_OFFSET_Y + jogo.GRID_ROWS * jogo.CELL_HEIGHT - self.img.get_height()
+        y_min = jogo.geometria.y0 + jogo.geometria.altura_celula * 0.5 
+        y_max = jogo.geometria.y_fim - self.img.get_height()
         
-        self.y_parada = random.uniform(y_min, y_max)
+        self.y_parada = jogo.rng.uniform(y_min, y_max)
         self.x_parada = None  # Posição X onde deve parar (usado para energia do girassol)
         
+        # Depois de pousar a energia dorme: sai do update por tick e some no tick
+        # expira_em (evento na agenda). None = ainda acordada
+        self.expira_em = None
+        self._evento = None
+        
+    @property
+    def pos(self):
+        return (self.x, self.y)
+    
+    def pos_desenho(self, alpha=1.0):
+        return interpolar(self.x_anterior, self.y_anterior, self.x, self.y, alpha)
+        
     def rect(self):
-        return pygame.Rect(self.pos, self.img.get_size())
+        """ Rect da energia (o mesmo objeto sempre; não modificar). """
+        return self._rect
+    
+    def parada(self):
+        """ True se já pousou e não se move mais (o próximo update só desconta a vida). """
+        return not self.onda and self.x_anterior == self.x and self.y_anterior == self.y
     
     def update(self):
         self.vida -= 1
         
+        self.x_anterior = self.x
+        self.y_anterior = self.y
+        
         if self.onda:
             # Aplica a velocidade horizontal e vertical
-            self.pos[0] += self.velocidade[0]
-            self.pos[1] += self.velocidade[1]
+            self.x += self.vx
+            self.y += self.vy
             
             # Aplica gravidade APENAS se for energia do girassol (que começa subindo)
             if self.usa_gravidade:
-                self.velocidade[1] += self.gravidade
+                self.vy += self.gravidade
 
             # Verifica se chegou na posição de parada
-            if self.pos[1] >= self.y_parada and self.velocidade[1] > 0:
-                self.pos[1] = self.y_parada
-                self.velocidade[1] = 0
-                self.velocidade[0] = 0
+            if self.y >= self.y_parada and self.vy > 0:
+                self.y = self.y_parada
+                self.vy = 0.0
+                self.vx = 0.0
                 self.onda = False 
+            
+            # Mesmo arredondamento do pygame.Rect(pos, tamanho) (trunca)
+            self._rect.x = int(self.x)
+            self._rect.y = int(self.y)
         
         if not self.onda:
             pass
 
         return self.vida <= 0
             
-    def draw(self, display):
-        display.blit(self.img, (int(self.pos[0]), int(self.pos[1])))
+    def draw(self, display, alpha=1.0):
+        display.blit(self.img, self.pos_desenho(alpha))
         
 # ===================================================
-# CLASSE PARTICULAS
+# SISTEMA DE PARTICULAS (arrays NumPy, uma linha por partícula)
 # ===================================================
-class particulas:
+class SistemaParticulas:
+    """ Guarda todas as partículas em arrays contíguos e atualiza tudo de uma vez.
+    
+    Tem um orçamento (soft) e um limite (hard) de partículas vivas:
+    - se o frame anterior pediu mais partículas que o orçamento, as próximas
+      emissões são reduzidas pelo fator_lod (e ele volta aos poucos para 1.0);
+    - se uma emissão passar do limite, as partículas de menor prioridade
+      (e, entre elas, as mais antigas) são descartadas para abrir espaço.
+    """
+    
+    GRAVIDADE = 0.05
+    COR_TRANSPARENTE = (255, 0, 255)  # Colorkey dos sprites de partícula
     
-    def __init__(self, pos, velocidade, vida, cor, tamanho=1, encolher_particula=True, gravidade=False):
+    # Classes de prioridade (maior ganha)
+    PRIORIDADE_BAIXA = 0  # Brilho, avisos, disparo
+    PRIORIDADE_MEDIA = 1  # Faíscas de acerto, plantio, spawn, coleta
+    PRIORIDADE_ALTA = 2   # Explosões e mortes
+    
+    FATOR_LOD_MIN = 0.1
+    RECUPERACAO_LOD = 0.05  # Quanto o fator_lod sobe por frame quando sobra orçamento
+    
+    def __init__(self, capacidade=1024, rng=None, orcamento=1500, limite=3000):
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.n = 0  # Partículas vivas ocupam as posições [0, n), da mais antiga para a mais nova
+        self._alocar(capacidade)
         
-        self.pos = list(pos)
-        self.velocidade = list(velocidade)
-        self.vida = vida
-        self.cor = cor
-        self.tamanho = tamanho
-        self.encolher_particula = encolher_particula
-        self.gravidade = gravidade
+        self.orcamento = orcamento
+        self.limite = limite
+        self.fator_lod = 1.0
+        self._vivas_inicio = 0  # Vivas no começo do frame
+        self._pedidas = 0  # Pedidas neste frame (antes do LOD)
         
-        self.vida_max = self.vida
-        self.tamanho_max = self.tamanho
+        self._sprites = {}  # (cor, raio) -> Surface
         
-    def atualizar(self): 
+    def _alocar(self, capacidade):
+        self.capacidade = capacidade
+        self.pos = np.zeros((capacidade, 2), dtype=np.float64)
+        self.velocidade = np.zeros((capacidade, 2), dtype=np.float64)
+        self.vida = np.zeros(capacidade, dtype=np.int32)
+        self.vida_max = np.ones(capacidade, dtype=np.int32)
+        self.cor = np.zeros((capacidade, 3), dtype=np.uint8)
+        self.tamanho = np.zeros(capacidade, dtype=np.int32)
+        self.tamanho_max = np.zeros(capacidade, dtype=np.int32)
+        self.gravidade = np.zeros(capacidade, dtype=bool)
+        self.encolher = np.zeros(capacidade, dtype=bool)
+        self.prioridade = np.zeros(capacidade, dtype=np.int8)
         
-        self.vida -= 1
+    def _arrays(self):
+        return (self.pos, self.velocidade, self.vida, self.vida_max, self.cor,
+                self.tamanho, self.tamanho_max, self.gravidade, self.encolher, self.prioridade)
+        
+    def _crescer(self, minimo):
+        """ Dobra a capacidade até caber 'minimo' partículas, copiando as vivas. """
+        nova = self.capacidade
+        while nova < minimo:
+            nova *= 2
         
-        if self.gravidade:
-            self.velocidade[1] += 0.05 
+        antigos = self._arrays()
+        self._alocar(nova)
+        for antigo, novo in zip(antigos, self._arrays()):
+            novo[:self.n] = antigo[:self.n]
             
-        self.pos[0] += self.velocidade[0]
-        self.pos[1] += self.velocidade[1]
+    def _manter(self, mascara):
+        """ Mantém só as partículas marcadas (preservando a ordem) e compacta os arrays. """
+        total = int(np.count_nonzero(mascara))
+        if total < self.n:
+            for arr in self._arrays():
+                arr[:total] = arr[:self.n][mascara]
+            self.n = total
+            
+    def _abrir_espaco(self, quantidade, prioridade):
+        """ Descarta até 'quantidade' partículas de prioridade <= 'prioridade',
+        menor prioridade primeiro e, dentro dela, as mais antigas. Retorna quantas saíram. """
+        candidatas = np.flatnonzero(self.prioridade[:self.n] <= prioridade)
+        if len(candidatas) == 0:
+            return 0
+        
+        # lexsort ordena pela última chave (prioridade) e desempata pelo índice (idade)
+        ordem = np.lexsort((candidatas, self.prioridade[candidatas]))
+        removidas = candidatas[ordem[:quantidade]]
         
-        if self.encolher_particula:
-            life_percent = max(self.vida, 0) / self.vida_max
-            self.tamanho = math.ceil(life_percent * self.tamanho_max)
+        mascara = np.ones(self.n, dtype=bool)
+        mascara[removidas] = False
+        self._manter(mascara)
+        return len(removidas)
             
-    def draw(self, display):
-        if self.vida > 0 and self.tamanho > 0:
-            pygame.draw.circle(display, self.cor, (int(self.pos[0]), int(self.pos[1])), int(self.tamanho))
\ No newline at end of file
+    def __len__(self):
+        return self.n
+        
+    def emitir(self, pos, cor, num_particulas, velocidade_max, vida_max, gravidade, tamanho_min, tamanho_max,
+               encolher_particula=True, prioridade=PRIORIDADE_MEDIA):
+        """ Cria num_particulas partículas de uma vez (mesmos sorteios de criar_particulas). """
+        if num_particulas <= 0:
+            return
+        
+        self._pedidas += num_particulas
+        
+        # Nível de detalhe: reduz a emissão se o frame anterior estourou o orçamento
+        if self.fator_lod < 1.0:
+            num_particulas = max(1, int(num_particulas * self.fator_lod))
+        
+        # Limite rígido: descarta as menos importantes ou corta a emissão
+        excesso = self.n + num_particulas - self.limite
+        if excesso > 0:
+            self._abrir_espaco(excesso, prioridade)
+            num_particulas = min(num_particulas, self.limite - self.n)
+            if num_particulas <= 0:
+                return
+        
+        if self.n + num_particulas > self.capacidade:
+            self._crescer(self.n + num_particulas)
+        
+        a, b = self.n, self.n + num_particulas
+        rng = self.rng
+        
+        self.pos[a:b] = pos
+        self.velocidade[a:b] = rng.uniform(-velocidade_max, velocidade_max, size=(num_particulas, 2))
+        vidas = rng.integers(vida_max // 2, vida_max, endpoint=True, size=num_particulas)
+        self.vida[a:b] = vidas
+        self.vida_max[a:b] = np.maximum(vidas, 1)
+        self.cor[a:b] = cor
+        tamanhos = rng.integers(tamanho_min, tamanho_max, endpoint=True, size=num_particulas)
+        self.tamanho[a:b] = tamanhos
+        self.tamanho_max[a:b] = tamanhos
+        self.gravidade[a:b] = gravidade
+        self.encolher[a:b] = encolher_particula
+        self.prioridade[a:b] = prioridade
+        
+        self.n = b
+        
+    def _ajustar_lod(self):
+        """ Recalcula o fator_lod com a demanda deste frame (vivas + pedidas). """
+        demanda = self._vivas_inicio + self._pedidas
+        
+        alvo = 1.0
+        if demanda > self.orcamento:
+            alvo = max(self.FATOR_LOD_MIN, self.orcamento / demanda)
+        
+        if alvo < self.fator_lod:
+            self.fator_lod = alvo  # Degrada na hora
+        else:
+            self.fator_lod = min(alvo, self.fator_lod + self.RECUPERACAO_LOD)  # Recupera devagar
+        
+    def atualizar(self):
+        """ Vida, gravidade, movimento e encolhimento de todas as partículas; remove as mortas. """
+        self._ajustar_lod()
+        
+        n = self.n
+        if n > 0:
+            vida = self.vida[:n]
+            vida -= 1
+            
+            self.velocidade[:n, 1] += np.where(self.gravidade[:n], self.GRAVIDADE, 0.0)
+            self.pos[:n] += self.velocidade[:n]
+            
+            encolhe = self.encolher[:n]
+            life_percent = np.maximum(vida, 0) / self.vida_max[:n]
+            novos_tamanhos = np.ceil(life_percent * self.tamanho_max[:n]).astype(np.int32)
+            self.tamanho[:n] = np.where(encolhe, novos_tamanhos, self.tamanho[:n])
+            
+            self._manter(vida > 0)
+        
+        self._vivas_inicio = self.n
+        self._pedidas = 0
+            
+    def _sprite(self, cor, raio):
+        """ Círculo pré-renderizado para (cor, raio). Só rasteriza na primeira vez. """
+        chave = (cor, raio)
+        sprite = self._sprites.get(chave)
+        if sprite is None:
+            fundo = (0, 0, 0) if cor == self.COR_TRANSPARENTE else self.COR_TRANSPARENTE
+            sprite = pygame.Surface((raio * 2, raio * 2))
+            sprite.fill(fundo)
+            sprite.set_colorkey(fundo, pygame.RLEACCEL)
+            pygame.draw.circle(sprite, cor, (raio, raio), raio)
+            if pygame.display.get_surface() is not None:
+                sprite = sprite.convert()  # Mesmo formato da tela: blit sem conversão
+            self._sprites[chave] = sprite
+        return sprite
+        
+    def _pos_desenho(self, visiveis, alpha):
+        """ Posições interpoladas: o último passo foi pos += velocidade, então
+        a posição do tick anterior é pos - velocidade. """
+        pos = self.pos[:self.n][visiveis]
+        if alpha < 1.0:
+            pos = pos - self.velocidade[:self.n][visiveis] * (1.0 - alpha)
+        return pos.astype(np.int32)
+        
+    def retangulos(self, alpha=1.0):
+        """ Retângulos (x, y, w, h) ocupados pelas partículas visíveis (para dirty rects). """
+        n = self.n
+        visiveis = self.tamanho[:n] > 0
+        tamanhos = self.tamanho[:n][visiveis]
+        cantos = self._pos_desenho(visiveis, alpha) - tamanhos[:, None]
+        return [(x, y, t * 2, t * 2) for (x, y), t in zip(cantos.tolist(), tamanhos.tolist())]
+        
+    def draw(self, display, alpha=1.0):
+        """ Desenha todas as partículas com um único Surface.blits. """
+        n = self.n
+        visiveis = self.tamanho[:n] > 0
+        tamanhos = self.tamanho[:n][visiveis]
+        # Canto superior esquerdo do sprite = centro - raio
+        cantos = (self._pos_desenho(visiveis, alpha) - tamanhos[:, None]).tolist()
+        cores = [tuple(c) for c in self.cor[:n][visiveis].tolist()]
+        
+        sprite = self._sprite
+        display.blits(
+            [(sprite(cor, tamanho), canto) for cor, tamanho, canto in zip(cores, tamanhos.tolist(), cantos)],
+            doreturn=False
+        )
@@ -0,0 +1,161 @@
+# scripts/Perfil.py
+
+import csv
+import json
+from collections import deque
+from time import perf_counter_ns
+
+import numpy as np
+import pygame
+
+
+class Perfilador:
+    """ Mede quanto tempo cada fase do frame leva.
+
+    As fases são medidas em sequência ("voltas"): marcar(fase) soma à fase o
+    tempo desde a marca anterior. Quem mede guarda uma referência ao perfilador
+    e só chama marcar() se ela não for None, então desligado o custo é um
+    "if" por fase.
+
+    Cada frame vira um registro (ns por fase + quantidade de entidades), guardado
+    numa janela móvel para o overlay e, se gravar=True, numa lista para exportar.
+    """
+
+    # Ordem fixa das colunas (fases da simulação são somadas entre os ticks do frame)
+    FASES = [
+        "eventos",
+        "spawn", "energias", "inimigos", "indice", "torres", "projeteis", "particulas",
+        "desenho_fundo", "desenho_entidades", "desenho_efeitos", "desenho_hud", "apresentar",
+    ]
+    CONTAGENS = ["ticks", "inimigos_n", "torres_n", "energias_n", "projeteis_n", "particulas_n"]
+
+    JANELA = 240  # Frames usados nas médias e no p99
+    ATUALIZAR_OVERLAY = 15  # O texto do overlay é refeito a cada N frames
+
+    def __init__(self, gravar=False):
+        self.ativo = gravar  # Mede se gravando ou com o overlay ligado (ver alternar)
+        self.overlay = False
+        self.gravar = gravar
+
+        self.registros = []
+        self.frame = 0
+        self.janela = {fase: deque(maxlen=self.JANELA) for fase in self.FASES + ["total"]}
+
+        self.atual = None
+        self._ultimo = 0
+
+        self.font = None
+        self.superficie = None
+
+    # ===================================================
+    # MEDIÇÃO
+    # ===================================================
+    def inicio_frame(self):
+        self.atual = dict.fromkeys(self.FASES, 0)
+        self._ultimo = perf_counter_ns()
+
+    def marcar(self, fase):
+        """ Soma à fase o tempo desde a última marca. """
+        agora = perf_counter_ns()
+        self.atual[fase] = self.atual.get(fase, 0) + agora - self._ultimo
+        self._ultimo = agora
+
+    def fim_frame(self, sim, ticks):
+        registro = self.atual
+        total = sum(registro.values())
+
+        for fase, ns in registro.items():
+            if fase in self.janela:
+                self.janela[fase].append(ns)
+        self.janela["total"].append(total)
+
+        if self.gravar:
+            registro["frame"] = self.frame
+            registro["total"] = total
+            registro["ticks"] = ticks
+            registro["inimigos_n"] = len(sim.inimigos)
+            registro["torres_n"] = len(sim.torres)
+            registro["energias_n"] = len(sim.energias_caindo)
+            registro["projeteis_n"] = len(sim.projeteis)
+            registro["particulas_n"] = len(sim.particulas)
+            self.registros.append(registro)
+
+        self.frame += 1
+        if self.overlay and self.frame % self.ATUALIZAR_OVERLAY == 0:
+            self.superficie = None
+        self.atual = None
+
+    def alternar(self):
+        """ Liga/desliga a medição junto com o overlay (tecla F3). """
+        self.overlay = not self.overlay
+        self.ativo = self.overlay or self.gravar
+        self.superficie = None
+
+    # ===================================================
+    # ESTATÍSTICAS
+    # ===================================================
+    def estatisticas(self):
+        """ fase -> (média, p99) em milissegundos, sobre a janela móvel. """
+        resultado = {}
+        for fase, valores in self.janela.items():
+            if not valores:
+                continue
+            ms = np.fromiter(valores, dtype=np.float64, count=len(valores)) / 1e6
+            resultado[fase] = (float(ms.mean()), float(np.percentile(ms, 99)))
+        return resultado
+
+    # ===================================================
+    # OVERLAY
+    # ===================================================
+    POS_OVERLAY = (560, 390)
+
+    def _render_overlay(self, sim):
+        if self.font is None:
+            self.font = pygame.font.Font(None, 18)
+
+        linhas = [f"{'fase':<18}{'media':>7}{'p99':>7}"]
+        for fase, (media, p99) in self.estatisticas().items():
+            linhas.append(f"{fase:<18}{media:>7.2f}{p99:>7.2f}")
+        linhas.append(f"inim {len(sim.inimigos)}  torres {len(sim.torres)}  proj {len(sim.projeteis)}")
+        linhas.append(f"part {len(sim.particulas)}  energia {len(sim.energias_caindo)}")
+
+        renderizadas = [self.font.render(texto, True, (220, 220, 220)) for texto in linhas]
+        largura = max(linha.get_width() for linha in renderizadas) + 8
+        altura = len(renderizadas) * 14 + 8
+
+        superficie = pygame.Surface((largura, altura))
+        superficie.fill((20, 20, 40))
+        for i, linha in enumerate(renderizadas):
+            superficie.blit(linha, (4, 4 + i * 14))
+        return superficie
+
+    def retangulos(self):
+        """ Área do overlay (para o modo de retângulos sujos). """
+        if not self.overlay or self.superficie is None:
+            return []
+        return [self.superficie.get_rect(topleft=self.POS_OVERLAY)]
+
+    def draw(self, display, sim):
+        if not self.overlay:
+            return
+        if self.superficie is None:
+            self.superficie = self._render_overlay(sim)
+        display.blit(self.superficie, self.POS_OVERLAY)
+
+    # ===================================================
+    # EXPORTAÇÃO
+    # ===================================================
+    def exportar(self, caminho):
+        """ Grava os registros por frame em CSV ou JSON (pela extensão do arquivo). """
+        colunas = ["frame", "total"] + self.FASES + self.CONTAGENS
+
+        if caminho.endswith(".json"):
+            with open(caminho, "w") as arquivo:
+                json.dump(self.registros, arquivo)
+        else:
+            with open(caminho, "w", newline="") as arquivo:
+                escritor = csv.DictWriter(arquivo, fieldnames=colunas, extrasaction="ignore")
+                escritor.writeheader()
+                escritor.writerows(self.registros)
+
+        print(f"Perfil salvo em {caminho} ({len(self.registros)} frames)")
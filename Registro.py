@@ -0,0 +1,72 @@
+# scripts/Registro.py
+
+import atexit
+import logging
+import logging.handlers
+import queue
+import sys
+import time
+
+# Mensagens do jogo. Use formato com % e argumentos separados (log.info("Total: %s", total)):
+# o texto só é montado se a mensagem passar do nível e do limite de taxa,
+# e o modelo da mensagem identifica o "tipo" dela no limite.
+log = logging.getLogger("pvz")
+
+
+class LimiteTaxa(logging.Filter):
+    """ Deixa passar no máximo `maximo` mensagens de cada tipo por janela de `janela` segundos.
+
+    As descartadas são contadas e a próxima que passar avisa quantas foram.
+    """
+
+    def __init__(self, maximo=5, janela=1.0):
+        super().__init__()
+        self.maximo = maximo
+        self.janela = janela
+        self.estado = {}  # modelo da mensagem -> [início da janela, enviadas, suprimidas]
+
+    def filter(self, record):
+        agora = time.monotonic()
+        estado = self.estado.get(record.msg)
+        if estado is None or agora - estado[0] >= self.janela:
+            suprimidas = estado[2] if estado is not None else 0
+            estado = self.estado[record.msg] = [agora, 0, 0]
+            if suprimidas:
+                record.msg = f"{record.msg} (+{suprimidas} iguais suprimidas)"
+
+        if estado[1] >= self.maximo:
+            estado[2] += 1
+            return False
+        estado[1] += 1
+        return True
+
+
+_ouvinte = None
+
+
+def configurar(nivel=logging.INFO, maximo_por_segundo=5, saida=None):
+    """ Liga a saída das mensagens do jogo (uma vez; chamadas seguintes só mudam o nível).
+
+    O jogo só enfileira as mensagens: quem escreve no terminal é uma thread
+    separada (QueueListener), então um stdout lento não trava o loop.
+    Sem configurar(), só avisos e erros aparecem (no stderr, direto).
+    """
+    global _ouvinte
+
+    log.setLevel(nivel)
+    if _ouvinte is not None:
+        return
+
+    fila = queue.SimpleQueue()
+    enfileirar = logging.handlers.QueueHandler(fila)
+    enfileirar.addFilter(LimiteTaxa(maximo_por_segundo))
+
+    escrever = logging.StreamHandler(saida if saida is not None else sys.stdout)
+    escrever.setFormatter(logging.Formatter("%(message)s"))
+
+    _ouvinte = logging.handlers.QueueListener(fila, escrever)
+    _ouvinte.start()
+    atexit.register(_ouvinte.stop)  # Esvazia a fila antes de sair
+
+    log.addHandler(enfileirar)
+    log.propagate = False
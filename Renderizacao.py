@@ -0,0 +1,169 @@
+# scripts/Renderizacao.py
+
+import pygame
+
+
+class CamadaGrid:
+    """ Fundo com as linhas do grid e o contorno das células ocupadas.
+
+    Fica guardado numa Surface; a cada frame só as células que mudaram
+    (sim.celulas_alteradas) são repintadas. Se o tamanho do grid mudar,
+    a camada é refeita do zero.
+    """
+
+    COR_FUNDO = (0, 0, 0)
+    LINE_COLOR = (50, 50, 50)
+    OCCUPIED_COLOR = (0, 100, 0)
+
+    def __init__(self, tamanho):
+        self.surface = pygame.Surface(tamanho)
+        if pygame.display.get_surface() is not None:
+            self.surface = self.surface.convert()
+
+        self.geometria = None  # sim.geometria da última pintura (outra geometria = grid mudou)
+
+    def redesenhar(self, sim):
+        """ Pinta a camada inteira (primeiro frame ou grid redimensionado). """
+        geometria = self.geometria = sim.geometria
+        self.surface.fill(self.COR_FUNDO)
+
+        for y in [topo for topo, _ in geometria.faixas_linhas] + [geometria.y_fim]:
+            pygame.draw.line(self.surface, self.LINE_COLOR, (geometria.x0, y), (geometria.x_fim, y))
+
+        for x in geometria.xs_colunas + [geometria.x_fim]:
+            pygame.draw.line(self.surface, self.LINE_COLOR, (x, geometria.y0), (x, geometria.y_fim))
+
+        for row in range(geometria.linhas):
+            for col in range(geometria.colunas):
+                if sim.grid[row][col] is not None:
+                    self._contorno(row, col)
+
+        sim.celulas_alteradas.clear()
+
+    def _contorno(self, row, col):
+        pygame.draw.rect(self.surface, self.OCCUPIED_COLOR, self.geometria.retangulo(row, col), 1)
+
+    def repintar_celula(self, sim, row, col):
+        """ Repinta só a área da célula: a linha de cima, a da esquerda e o contorno se ocupada.
+
+        As linhas da direita e de baixo pertencem às células vizinhas (ou à borda
+        do grid), então cada pixel do grid é de exatamente uma célula.
+        """
+        x, y, largura, altura = retangulo = self.geometria.retangulo(row, col)
+
+        self.surface.fill(self.COR_FUNDO, retangulo)
+        pygame.draw.line(self.surface, self.LINE_COLOR, (x, y), (x + largura - 1, y))
+        pygame.draw.line(self.surface, self.LINE_COLOR, (x, y), (x, y + altura - 1))
+
+        if sim.grid[row][col] is not None:
+            self._contorno(row, col)
+
+        return pygame.Rect(retangulo)
+
+    def atualizar(self, sim):
+        """ Aplica as mudanças de ocupação desde o último frame.
+
+        Retorna os retângulos repintados, ou None se a camada foi refeita inteira.
+        """
+        if self.geometria is not sim.geometria:
+            self.redesenhar(sim)
+            return None
+
+        repintados = [self.repintar_celula(sim, row, col) for row, col in sim.celulas_alteradas]
+        sim.celulas_alteradas.clear()
+        return repintados
+
+    def draw(self, display, sim):
+        self.atualizar(sim)
+        display.blit(self.surface, (0, 0))
+
+
+class RenderizadorParcial:
+    """ Modo de desenho por retângulos sujos (dirty rects).
+
+    Em vez de limpar e apresentar a tela inteira, restaura o fundo só onde havia
+    algo móvel no frame anterior e envia para a tela (display.update) apenas
+    essas áreas mais as áreas desenhadas agora. Se houver retângulos demais,
+    cai para o flip normal.
+    """
+
+    LIMITE_RETANGULOS = 300
+
+    def __init__(self, fundo):
+        self.fundo = fundo
+
+        self.anteriores = []  # Retângulos dos elementos móveis do frame anterior
+        self.torres_anteriores = {}  # id(torre) -> Rect
+        self.sujos = None  # None = tela inteira
+        self.primeiro_frame = True
+
+    def _retangulos_torres(self, sim):
+        return {id(torre): torre.rect() for torre in sim.torres}
+
+    def apagar(self, display, sim):
+        """ Restaura o fundo onde for preciso. Chamar antes de desenhar as entidades. """
+        repintados = self.fundo.atualizar(sim)
+        torres_atuais = self._retangulos_torres(sim)
+
+        if self.primeiro_frame or repintados is None:
+            # Primeiro frame (ou grid refeito): fundo inteiro
+            display.blit(self.fundo.surface, (0, 0))
+            self.sujos = None
+            self.torres_anteriores = torres_atuais
+            self.primeiro_frame = False
+            return
+
+        apagar = self.anteriores + repintados
+
+        # Torres que sumiram ou mudaram de lugar, e as que piscam (animadas)
+        for chave, rect in self.torres_anteriores.items():
+            if torres_atuais.get(chave) != rect:
+                apagar.append(rect)
+        novas = []
+        for torre in sim.torres:
+            rect = torres_atuais[id(torre)]
+            if torre.ANIMADA:
+                apagar.append(rect)
+            elif self.torres_anteriores.get(id(torre)) != rect:
+                novas.append(rect)
+
+        for rect in apagar:
+            display.blit(self.fundo.surface, rect, rect)
+
+        self.sujos = apagar + novas
+        self.torres_anteriores = torres_atuais
+
+    def retangulos_moveis(self, sim, hud, alpha=1.0):
+        """ Áreas ocupadas neste frame por tudo que se move ou muda. """
+        retangulos = []
+
+        for inimigo in sim.inimigos:
+            x, y = inimigo.pos_desenho(alpha)
+            largura, altura = inimigo.img.get_size()
+            # Inclui a barra de vida (40px, 10px acima)
+            retangulos.append(pygame.Rect(x, y - 10, max(largura, 40), altura + 10))
+
+        retangulos.extend(sim.projeteis.retangulos(alpha))
+
+        for energia_obj in sim.energias_caindo:
+            retangulos.append(pygame.Rect(energia_obj.pos_desenho(alpha), energia_obj.img.get_size()))
+
+        retangulos.extend(sim.particulas.retangulos(alpha))
+        retangulos.extend(hud.retangulos())
+
+        return retangulos
+
+    def apresentar(self, sim, hud, alpha=1.0, extras=()):
+        """ Envia para a tela só o que mudou. Chamar depois de desenhar tudo.
+
+        extras: áreas desenhadas por fora do jogo (ex.: overlay do perfil).
+        """
+        novos = self.retangulos_moveis(sim, hud, alpha)
+        novos.extend(extras)
+
+        if self.sujos is None or len(self.sujos) + len(novos) > self.LIMITE_RETANGULOS:
+            pygame.display.flip()
+        else:
+            pygame.display.update(self.sujos + novos)
+
+        self.anteriores = novos
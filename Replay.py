@@ -0,0 +1,108 @@
+# scripts/Replay.py
+#
+# Reproduz uma partida gravada, sem janela e na velocidade máxima:
+#
+#   python -m scripts.Replay sessao.json
+
+import hashlib
+import json
+import os
+import sys
+import time
+
+
+class Gravacao:
+    """ Entradas do jogador carimbadas com o tick em que aconteceram.
+
+    Junto com a semente da Simulation isso basta para refazer a partida: as
+    entradas são aplicadas entre ticks, no mesmo tick em que foram feitas.
+
+    Cada entrada é uma lista curta:
+        [tick, "torre", nome_da_classe, row, col]
+        [tick, "energia", x, y]
+    """
+
+    def __init__(self, semente, entradas=None):
+        self.semente = semente
+        self.entradas = entradas if entradas is not None else []
+
+    def registrar(self, tick, acao, *args):
+        self.entradas.append([tick, acao, *args])
+
+    def salvar(self, caminho, sim):
+        """ Grava as entradas e o resultado final (para conferir o replay). """
+        dados = {
+            "semente": self.semente,
+            "ticks": sim.tick,
+            "resumo": resumo(sim),
+            "entradas": self.entradas,
+        }
+        with open(caminho, "w") as arquivo:
+            json.dump(dados, arquivo, separators=(",", ":"))
+        print(f"Partida gravada em {caminho} ({len(self.entradas)} entradas, {sim.tick} ticks)")
+
+    @staticmethod
+    def carregar(caminho):
+        with open(caminho) as arquivo:
+            return json.load(arquivo)
+
+
+def resumo(sim):
+    """ Contagens e um hash do estado das entidades: dois resumos iguais = mesma partida. """
+    estado = (
+        # float(): a vida pode virar float do NumPy ao receber dano de projétil
+        [(inimigo.row, inimigo.x, inimigo.y, float(inimigo.vida)) for inimigo in sim.inimigos],
+        [(torre.grid_pos, float(torre.vida)) for torre in sim.torres],
+        [(energia_obj.x, energia_obj.y) for energia_obj in sim.energias_caindo],
+    )
+    return {
+        "tick": sim.tick,
+        "energia": sim.total_energia,
+        "inimigos": len(sim.inimigos),
+        "torres": len(sim.torres),
+        "energias": len(sim.energias_caindo),
+        "projeteis": len(sim.projeteis),
+        "estado": hashlib.sha1(repr(estado).encode()).hexdigest(),
+    }
+
+
+def reproduzir(dados, assets=None):
+    """ Roda a partida gravada até o último tick e devolve a Simulation. """
+    from .Simulacao import Simulation
+
+    sim = Simulation(assets=assets, semente=dados["semente"])
+    torres = {classe.__name__: classe for classe in sim.TORRES}
+
+    for tick, acao, *args in dados["entradas"]:
+        sim.step(tick - sim.tick)
+        if acao == "torre":
+            nome, row, col = args
+            sim.colocar_torre(torres[nome], row, col)
+        elif acao == "energia":
+            sim.coletar_energia(tuple(args))
+
+    sim.step(dados["ticks"] - sim.tick)
+    return sim
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+    if len(sys.argv) < 2:
+        print("Uso: python -m scripts.Replay sessao.json")
+        sys.exit(2)
+
+    dados = Gravacao.carregar(sys.argv[1])
+
+    inicio = time.perf_counter()
+    sim = reproduzir(dados)
+    duracao = time.perf_counter() - inicio
+
+    obtido = resumo(sim)
+    print(f"{sim.tick} ticks em {duracao:.2f} s ({sim.tick / duracao:.0f} ticks/s)")
+    print(obtido)
+
+    if obtido != dados["resumo"]:
+        print(f"DIVERGIU da gravação: {dados['resumo']}")
+        sys.exit(1)
+    print("Igual à gravação.")
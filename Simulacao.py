@@ -0,0 +1,464 @@
+# scripts/Simulacao.py
+
+import random
+from collections import Counter
+
+import numpy as np
+# Importações de Mecanicas
+from .Mecanicas import Energia, SistemaParticulas, SistemaProjeteis
+# Importações de Torres e Inimigos
+from .Inimigos import Inimigo
+from .Torres import Peashooter, NozObstaculo, Girassol, CerejaBomba
+from .Espacial import IndiceLinhas
+from .Grade import GeometriaGrade
+from .Agenda import Agenda
+from .Assets import GerenciadorAssets
+from .Registro import log
+
+
+def _medida_grade(campo):
+    """ Atributo do grid (GRID_ROWS, CELL_WIDTH...) lido da geometria. Só leitura: o tamanho
+    do grid é escolhido ao criar a Simulation (grid, índice e projéteis dependem dele). """
+    return property(lambda self: getattr(self.geometria, campo))
+
+
+class Simulation:
+    """ Núcleo da simulação: estado do mundo e lógica por tick, sem janela nem relógio. """
+
+    LARGURA_TELA = 800
+    ALTURA_TELA = 600
+
+    # Todos os tempos (cooldowns, spawns, vida) são contados em ticks desta taxa
+    TICKS_POR_SEGUNDO = 60
+
+    # Sorteios de balanceamento (mínimo, máximo); o Lote.py varia estes valores
+    INTERVALO_SPAWN_INIMIGO = (300, 540)  # Ticks entre inimigos
+    INTERVALO_SPAWN_ENERGIA = (300, 450)  # Ticks entre energias do céu
+    VELOCIDADE_INIMIGO = (0.1, 0.4)  # Pixels por tick
+
+    # Tipo de torre -> (chave do asset, cor das partículas de plantio, quantidade)
+    TORRES = {
+        Peashooter: ("peashooter", (0, 200, 0), 15),
+        NozObstaculo: ("noz", (139, 69, 19), 15),
+        Girassol: ("girassol", (255, 215, 0), 20),  # Dourado
+        CerejaBomba: ("cereja", (255, 0, 0), 25),  # Vermelho
+    }
+
+    GRID_ROWS = _medida_grade("linhas")
+    GRID_COLS = _medida_grade("colunas")
+    CELL_WIDTH = _medida_grade("largura_celula")
+    CELL_HEIGHT = _medida_grade("altura_celula")
+    GRID_OFFSET_X = _medida_grade("x0")
+    GRID_OFFSET_Y = _medida_grade("y0")
+
+    def __init__(self, assets=None, orcamento_particulas=1500, limite_particulas=3000, semente=None,
+                 linhas=6, colunas=9):
+
+        # Imagens (GerenciadorAssets); sem janela aberta elas não são convertidas
+        self.assets = assets if assets is not None else GerenciadorAssets()
+
+        # Todo sorteio do jogo (spawns, cooldowns, energias, partículas) sai destes geradores:
+        # a mesma semente com as mesmas entradas reproduz a partida inteira
+        self.semente = semente if semente is not None else random.randrange(2 ** 32)
+        self.rng = random.Random(self.semente)
+
+        self.particulas = SistemaParticulas(rng=np.random.default_rng(self.semente),
+                                            orcamento=orcamento_particulas, limite=limite_particulas)
+        self.torres = []
+        self.inimigos = []
+        self.energias_caindo = []  # Todas as energias na tela (desenho e coleta)
+        self.energias_ativas = []  # As que ainda se movem (update por tick); as paradas dormem
+
+        # Centros, retângulos e conversões pixel <-> célula pré-calculados (Grade.py)
+        self.geometria = GeometriaGrade(linhas=linhas, colunas=colunas, largura_celula=65, altura_celula=80, x0=50, y0=100)
+
+        self.grid = [[None for _ in range(self.GRID_COLS)] for _ in range(self.GRID_ROWS)]
+        # Células cuja ocupação mudou desde o último frame desenhado
+        self.celulas_alteradas = set()
+
+        # Borda direita do mundo: a da tela, ou a do grid se ele for mais largo.
+        # Inimigos entram depois dela e projéteis somem depois dela
+        self.borda_direita = max(self.LARGURA_TELA, self.geometria.x_fim)
+
+        # Inimigos por linha, ordenados por x (alvos, colisões e explosões)
+        self.indice_inimigos = IndiceLinhas(self.GRID_ROWS)
+        self._inimigos_removidos = False  # Há inimigos marcados esperando a compactação
+
+        # Projéteis em arrays por linha
+        self.projeteis = SistemaProjeteis(self.assets.imagem("projetil", "proje"), self.GRID_ROWS,
+                                          limite_x=self.borda_direita + 50)
+
+        # Timers (cooldowns das torres e spawns) são eventos agendados, não contadores por tick
+        self.agenda = Agenda()
+        # Peashooters prontos sem alvo, por linha: dormem até entrar inimigo na linha
+        self.peashooters_dormentes = [[] for _ in range(self.GRID_ROWS)]
+        self._torres_removidas = False  # Há torres marcadas esperando a compactação
+
+        # Ticks (absolutos) dos próximos spawns
+        self.proximo_spawn_inimigo = 180
+        self.proximo_spawn_energia = 300
+        self._evento_spawn_inimigo = None
+        self._evento_spawn_energia = None
+        self.agendar_spawn_inimigo()
+        self.agendar_spawn_energia()
+        self.total_energia = 50  # CORRIGIDO: Inicia com 50 de energia
+
+        self.perfil = None  # Perfilador (Perfil.py) ligado pelo Game; None = sem medição
+        self.gravacao = None  # Gravacao (Replay.py) das entradas do jogador; None = não grava
+
+        # Métricas da partida (inimigos vazados, sóis produzidos...) no lugar de mensagens no console
+        self.contadores = Counter()
+
+        self.tick = 0
+
+    def get_cell_center(self, row, col):
+        """ Retorna a posição central de uma célula (para posicionar sprites). """
+        return self.geometria.centro(row, col)
+
+    def get_cell_coords(self, mouse_pos):
+        """ Retorna a linha (row) e coluna (col) do grid a partir da posição do mouse (pixel). """
+        return self.geometria.celula(mouse_pos)  # (None, None) fora da área
+
+    def remover_inimigos(self, inimigos):
+        """ Remove vários inimigos de uma vez (ex.: explosão).
+
+        Saem do índice espacial na hora; a lista self.inimigos é compactada
+        uma vez só, no fim da fase das torres.
+        """
+        for inimigo in inimigos:
+            inimigo.removido = True
+        self.indice_inimigos.remover_varios(inimigos)
+        if inimigos:
+            self._inimigos_removidos = True
+
+    def acordar_peashooters(self, row):
+        """ Os Peashooters dormentes da linha atiram se tiverem alvo; os outros voltam a dormir. """
+        dormentes = self.peashooters_dormentes[row]
+        if not dormentes:
+            return
+        self.peashooters_dormentes[row] = []
+        for peashooter in dormentes:
+            if not peashooter.removida and not peashooter.atirar_se_houver_alvo():
+                self.peashooters_dormentes[row].append(peashooter)
+
+    def definir_celula(self, row, col, torre):
+        """ Ocupa (ou libera, com None) uma célula do grid e registra a mudança. """
+        self.grid[row][col] = torre
+        self.celulas_alteradas.add((row, col))
+
+    def criar_particulas(self, pos, cor, num_particulas=10, velocidade_max=2, vida_max=30, gravidade=True, tamanho_min=2, tamanho_max=5,
+                         prioridade=SistemaParticulas.PRIORIDADE_MEDIA):
+        self.particulas.emitir(
+            pos=pos,
+            cor=cor,
+            num_particulas=num_particulas,
+            velocidade_max=velocidade_max,
+            vida_max=vida_max,
+            gravidade=gravidade,
+            tamanho_min=tamanho_min,
+            tamanho_max=tamanho_max,
+            prioridade=prioridade
+        )
+
+    # ------------------------------------
+    # AÇÕES DO JOGADOR
+    # ------------------------------------
+    def colocar_torre(self, classe_torre, row, col):
+        """ Tenta plantar uma torre na célula (row, col). Retorna a torre criada ou None. """
+        custo_torre = classe_torre.CUSTO_ENERGIA
+
+        if row is None or col is None:
+            return None
+
+        if self.gravacao is not None:
+            self.gravacao.registrar(self.tick, "torre", classe_torre.__name__, row, col)
+
+        if self.total_energia < custo_torre:
+            self.contadores["plantios_sem_energia"] += 1
+            log.info("Energia insuficiente! Necessário: %s, Atual: %s", custo_torre, self.total_energia)
+            return None
+
+        if self.grid[row][col] is not None:
+            self.contadores["plantios_celula_ocupada"] += 1
+            log.info("Célula (%s, %s) já ocupada.", row, col)
+            return None
+
+        tipo, cor, num_particulas = self.TORRES[classe_torre]
+
+        torre_x, torre_y = self.geometria.posicao_sprite(self.assets.imagem("torre", tipo).get_size(), row, col)
+
+        nova_torre = classe_torre(jogo=self, pos=(torre_x, torre_y), grid_pos=(row, col))
+
+        self.total_energia -= custo_torre
+        self.contadores["torres_plantadas"] += 1
+        self.torres.append(nova_torre)
+        self.definir_celula(row, col, nova_torre)
+        nova_torre.agendar()
+
+        self.criar_particulas(
+            pos=nova_torre.rect().center,
+            cor=cor,
+            num_particulas=num_particulas,
+            gravidade=False,
+            vida_max=40
+        )
+
+        if classe_torre is Girassol:
+            log.info("Girassol plantado! Energia: %s", self.total_energia)
+        elif classe_torre is CerejaBomba:
+            log.info("💣 Cereja-Bomba plantada! Explode em 3 segundos! Energia: %s", self.total_energia)
+
+        return nova_torre
+
+    def coletar_energia(self, pos):
+        """ Coleta a energia sob a posição (pixel). Retorna True se coletou alguma. """
+        if self.gravacao is not None:
+            self.gravacao.registrar(self.tick, "energia", pos[0], pos[1])
+
+        for i in range(len(self.energias_caindo) - 1, -1, -1):
+            energia_obj = self.energias_caindo[i]
+
+            if energia_obj.rect().collidepoint(pos):
+                self.total_energia += energia_obj.valor
+
+                self.criar_particulas(
+                    pos=energia_obj.pos,
+                    cor=(255, 255, 0),
+                    num_particulas=20,
+                    velocidade_max=1.5,
+                    vida_max=40,
+                    gravidade=True
+                )
+
+                self.energias_caindo.pop(i)
+                if energia_obj.expira_em is not None:
+                    Agenda.cancelar(energia_obj._evento)
+                else:
+                    self.energias_ativas.remove(energia_obj)
+                self.contadores["energias_coletadas"] += 1
+                log.info("Energia Coletada! Total: %s", self.total_energia)
+                return True
+
+        return False
+
+    # ------------------------------------
+    # SPAWNS (agendados)
+    # ------------------------------------
+    def agendar_spawn_inimigo(self):
+        """ (Re)agenda o spawn de inimigo para o tick proximo_spawn_inimigo. """
+        Agenda.cancelar(self._evento_spawn_inimigo)
+        self._evento_spawn_inimigo = self.agenda.agendar(
+            self.proximo_spawn_inimigo, Agenda.FASE_SPAWN_INIMIGO, self._spawn_inimigo)
+
+    def agendar_spawn_energia(self):
+        """ (Re)agenda o spawn de energia para o tick proximo_spawn_energia. """
+        Agenda.cancelar(self._evento_spawn_energia)
+        self._evento_spawn_energia = self.agenda.agendar(
+            self.proximo_spawn_energia, Agenda.FASE_SPAWN_ENERGIA, self._spawn_energia)
+
+    def _spawn_inimigo(self):
+        self._evento_spawn_inimigo = None
+        self.proximo_spawn_inimigo = self.tick + self.rng.randint(*self.INTERVALO_SPAWN_INIMIGO)
+        self.agendar_spawn_inimigo()
+
+        row = self.rng.randint(0, self.GRID_ROWS - 1)
+
+        geometria = self.geometria
+        center_y = geometria.centro(row, geometria.colunas - 1)[1]
+
+        spawn_x = self.borda_direita + 20
+        inimigo_y = geometria.posicao_sprite(self.assets.imagem("inimigo", "basico").get_size(), row, geometria.colunas - 1)[1]
+
+        novo_inimigo = Inimigo(
+            jogo=self,
+            tipo="basico",
+            pos=(spawn_x, inimigo_y),
+            vida=10,
+            velocidade=self.rng.uniform(*self.VELOCIDADE_INIMIGO),
+            dano=0.5,
+            row=row
+        )
+        self.inimigos.append(novo_inimigo)
+        self.indice_inimigos.inserir(novo_inimigo)
+
+        particula_spawn_x = geometria.x_fim - 10
+        particula_spawn_y = center_y
+
+        self.criar_particulas(
+            pos=(particula_spawn_x, particula_spawn_y),
+            cor=(139, 69, 19),
+            num_particulas=15,
+            velocidade_max=1.0,
+            vida_max=40,
+            gravidade=True
+        )
+
+    def _spawn_energia(self):
+        self._evento_spawn_energia = None
+        self.proximo_spawn_energia = self.tick + self.rng.randint(*self.INTERVALO_SPAWN_ENERGIA)
+        self.agendar_spawn_energia()
+
+        spawn_x = self.rng.randint(self.geometria.x0, self.geometria.x_fim - 30)
+
+        nova_energia = Energia(
+            jogo=self,
+            pos=(spawn_x, 0),
+            velocidade=[0, self.rng.uniform(0.5, 1.0)],
+            valor=25,
+            vida=480
+        )
+        self.adicionar_energia(nova_energia)
+
+    def adicionar_energia(self, energia_obj):
+        """ Coloca uma energia nova (acordada) no jogo. """
+        self.energias_caindo.append(energia_obj)
+        self.energias_ativas.append(energia_obj)
+
+    def adormecer_energia(self, energia_obj):
+        """ Tira a energia parada do update por tick; ela some sozinha no tick expira_em. """
+        if energia_obj.expira_em is None:
+            energia_obj.expira_em = self.tick + energia_obj.vida
+        energia_obj._evento = self.agenda.agendar(
+            energia_obj.expira_em, Agenda.FASE_ENERGIAS, lambda: self._expirar_energia(energia_obj))
+
+    def _expirar_energia(self, energia_obj):
+        energia_obj._evento = None
+        self.energias_caindo.remove(energia_obj)
+
+    # ------------------------------------
+    # PASSO DA SIMULAÇÃO
+    # ------------------------------------
+    def step(self, n_ticks=1):
+        """ Avança a simulação n_ticks ticks (1 tick = 1 / TICKS_POR_SEGUNDO segundos). """
+        for _ in range(n_ticks):
+            self._tick()
+
+    def _tick(self):
+        self.tick += 1
+        perfil = self.perfil
+
+        # ------------------------------------
+        # 1. SPAWN DE INIMIGOS E DE ENERGIA (MOEDA)
+        # ------------------------------------
+        self.agenda.executar(self.tick, Agenda.FASE_SPAWN_ENERGIA)
+
+        if perfil is not None:
+            perfil.marcar("spawn")
+
+        # ------------------------------------
+        # 2. UPDATE
+        # ------------------------------------
+
+        # As listas são percorridas de trás para frente (como sempre foram) e as
+        # entidades vivas vão para uma lista nova: remover custa uma passada só,
+        # em vez de um list.pop(i) por morte.
+
+        # UPDATE DAS ENERGIAS
+        # Só as que se movem; as paradas dormem até o evento de expiração (ou a coleta)
+        self.agenda.executar(self.tick, Agenda.FASE_ENERGIAS)
+
+        vivas = []
+        mortas = []
+        for energia_obj in reversed(self.energias_ativas):
+            morreu = energia_obj.update()
+
+            if morreu:
+                mortas.append(energia_obj)
+            elif energia_obj.parada():
+                self.adormecer_energia(energia_obj)
+            else:
+                vivas.append(energia_obj)
+        vivas.reverse()
+        self.energias_ativas = vivas
+        if mortas:
+            mortas = set(map(id, mortas))
+            self.energias_caindo = [energia_obj for energia_obj in self.energias_caindo if id(energia_obj) not in mortas]
+
+        if perfil is not None:
+            perfil.marcar("energias")
+
+        # UPDATE DOS INIMIGOS
+        vivos = []
+        mortos = []
+        for inimigo in reversed(self.inimigos):
+            morreu_ou_passou = inimigo.update()
+
+            if morreu_ou_passou:
+                if inimigo.vida <= 0:
+                    self.contadores["inimigos_mortos"] += 1
+                    self.criar_particulas(
+                        pos=inimigo.rect().center,
+                        cor=(255, 0, 0),
+                        num_particulas=30,
+                        velocidade_max=3,
+                        vida_max=60,
+                        prioridade=SistemaParticulas.PRIORIDADE_ALTA
+                    )
+                inimigo.removido = True
+                mortos.append(inimigo)
+            else:
+                vivos.append(inimigo)
+        vivos.reverse()
+        self.inimigos = vivos
+
+        if perfil is not None:
+            perfil.marcar("inimigos")
+
+        self.indice_inimigos.remover_varios(mortos)
+        self.indice_inimigos.reordenar()
+
+        if perfil is not None:
+            perfil.marcar("indice")
+
+        # UPDATE DAS TORRES
+        # Só age quem tem evento neste tick (cooldown acabou, sol pronto, explosão)
+        # e os Peashooters dormentes das linhas onde entrou inimigo
+        for row in self.indice_inimigos.consumir_entradas():
+            self.acordar_peashooters(row)
+
+        self.agenda.executar(self.tick, Agenda.FASE_TORRES)
+
+        # Torres mortas ou que explodiram saem da lista e do grid numa passada só
+        if self._torres_removidas:
+            vivas = []
+            linhas_afetadas = set()
+            for torre in self.torres:
+                if torre.removida:
+                    row, col = torre.grid_pos
+                    self.definir_celula(row, col, None)
+                    linhas_afetadas.add(row)
+                else:
+                    vivas.append(torre)
+            self.torres = vivas
+            for row in linhas_afetadas:
+                self.peashooters_dormentes[row] = [p for p in self.peashooters_dormentes[row] if not p.removida]
+            self._torres_removidas = False
+
+        # Inimigos removidos no meio do tick (explosões) saem da lista numa passada só
+        if self._inimigos_removidos:
+            self.inimigos = [inimigo for inimigo in self.inimigos if not inimigo.removido]
+            self._inimigos_removidos = False
+
+        if perfil is not None:
+            perfil.marcar("torres")
+
+        # COLISÃO E UPDATE DE PROJÉTEIS
+        for inimigo, dano, centro in self.projeteis.atualizar(self.indice_inimigos):
+            self.criar_particulas(
+                pos=centro,
+                cor=(100, 100, 100),
+                num_particulas=5,
+                velocidade_max=1,
+                vida_max=20
+            )
+
+            inimigo.receber_dano(dano)
+
+        if perfil is not None:
+            perfil.marcar("projeteis")
+
+        # UPDATE DAS PARTÍCULAS
+        self.particulas.atualizar()
+
+        if perfil is not None:
+            perfil.marcar("particulas")
@@ -0,0 +1,205 @@
+# scripts/Snapshot.py
+
+import io
+import json
+
+import numpy as np
+
+from .Inimigos import Inimigo
+from .Mecanicas import Energia
+from .Torres import Peashooter, Girassol, CerejaBomba
+from .Agenda import Agenda
+
+# Guarda o estado inteiro do mundo num arquivo .npz (arrays NumPy, sem pickle).
+#
+# As entidades viram tabelas float64, uma linha por entidade, com as colunas
+# listadas abaixo. Surfaces e referências ao jogo não são salvas: na volta,
+# as entidades são recriadas pelos construtores normais (com os assets que já
+# estão carregados) e os campos são sobrescritos.
+#
+# As partículas não entram (são só visuais); o gerador delas continua do mesmo
+# estado, mas a partida restaurada começa sem partículas na tela.
+
+VERSAO = 4
+
+# Tipos dos campos: float, int, bool ou OPCIONAL (float que pode ser None; salvo como NaN)
+OPCIONAL = "opcional"
+
+CAMPOS_INIMIGO = (
+    ("row", int), ("x", float), ("y", float), ("x_anterior", float), ("y_anterior", float),
+    ("velocidade_base", float), ("velocidade_atual", float), ("movendo", bool),
+    ("vida", float), ("vida_maxima", float), ("dano_ataque", float),
+    ("cooldown_ataque_max", int), ("cooldown_ataque_atual", int),
+)
+
+CAMPOS_ENERGIA = (
+    ("x", float), ("y", float), ("x_anterior", float), ("y_anterior", float), ("vx", float), ("vy", float),
+    ("valor", int), ("vida_maxima", int), ("vida", int), ("onda", bool),
+    ("tempo_parada_max", int), ("tempo_parada_atual", int), ("usa_gravidade", bool), ("gravidade", float),
+    ("y_parada", float), ("x_parada", OPCIONAL), ("expira_em", OPCIONAL),
+)
+
+CAMPOS_TORRE = (("x", float), ("y", float), ("vida", float), ("vida_maxima", float))
+
+# Campos próprios de cada tipo de torre (além de CAMPOS_TORRE)
+CAMPOS_POR_TORRE = {
+    Peashooter: (("pronto_em", int),),
+    Girassol: (("proxima_geracao", int), ("cooldown_max", int), ("primeira_geracao", bool)),
+    CerejaBomba: (("explode_em", int), ("explodiu", bool)),
+}
+
+
+# ===================================================
+# TABELAS
+# ===================================================
+def _tabela(objetos, campos, extras=()):
+    """ Uma linha por objeto: as colunas de extras (funções) seguidas dos campos. """
+    tabela = np.empty((len(objetos), len(extras) + len(campos)), dtype=np.float64)
+    for i, obj in enumerate(objetos):
+        linha = [extra(obj) for extra in extras]
+        for campo, tipo in campos:
+            valor = getattr(obj, campo)
+            linha.append(np.nan if valor is None else valor)
+        tabela[i] = linha
+    return tabela
+
+
+def _aplicar(obj, campos, linha):
+    for (campo, tipo), valor in zip(campos, linha):
+        if tipo is OPCIONAL:
+            valor = None if np.isnan(valor) else float(valor)
+        else:
+            valor = tipo(valor)
+        setattr(obj, campo, valor)
+
+
+# ===================================================
+# CAPTURA E RESTAURAÇÃO
+# ===================================================
+def capturar(sim):
+    """ Estado completo da Simulation em bytes (formato .npz do NumPy). """
+    tipos_inimigo = sorted({inimigo.tipo for inimigo in sim.inimigos})
+    classes_torre = list(sim.TORRES)
+
+    versao_rng, estado_rng, gauss_rng = sim.rng.getstate()
+    meta = {
+        "versao": VERSAO,
+        "tick": sim.tick,
+        "semente": sim.semente,
+        "total_energia": sim.total_energia,
+        "proximo_spawn_inimigo": sim.proximo_spawn_inimigo,
+        "proximo_spawn_energia": sim.proximo_spawn_energia,
+        "sequencia_spawns": [Agenda.sequencia(sim._evento_spawn_inimigo), Agenda.sequencia(sim._evento_spawn_energia)],
+        "contadores": dict(sim.contadores),
+        "grid": [sim.GRID_ROWS, sim.GRID_COLS],
+        "rng": [versao_rng, gauss_rng],
+        "rng_particulas": sim.particulas.rng.bit_generator.state,
+        "tipos_inimigo": tipos_inimigo,
+    }
+
+    arrays = {
+        "meta": np.frombuffer(json.dumps(meta).encode(), dtype=np.uint8),
+        "rng": np.array(estado_rng, dtype=np.uint32),  # Estado do Mersenne Twister (625 palavras)
+        "inimigos": _tabela(sim.inimigos, CAMPOS_INIMIGO, extras=(lambda inimigo: tipos_inimigo.index(inimigo.tipo),)),
+        # Energias: a primeira coluna é a ordem do evento de expiração (-1 = acordada)
+        "energias": _tabela(sim.energias_caindo, CAMPOS_ENERGIA, extras=(lambda energia_obj: Agenda.sequencia(energia_obj._evento),)),
+        "projeteis": sim.projeteis.estado(),
+    }
+
+    # Torres: uma tabela por tipo. Colunas extras: posição em sim.torres, célula, a ordem
+    # do evento pendente na agenda e a posição na lista de Peashooters dormentes da linha
+    # (para a partida restaurada executar os eventos na mesma ordem)
+    ordem = {id(torre): i for i, torre in enumerate(sim.torres)}
+    dormentes = {id(torre): i for linha in sim.peashooters_dormentes for i, torre in enumerate(linha)}
+    for classe in classes_torre:
+        torres = [torre for torre in sim.torres if type(torre) is classe]
+        campos = CAMPOS_TORRE + CAMPOS_POR_TORRE.get(classe, ())
+        arrays["torres_" + classe.__name__] = _tabela(torres, campos, extras=(
+            lambda torre: ordem[id(torre)],
+            lambda torre: torre.grid_pos[0],
+            lambda torre: torre.grid_pos[1],
+            lambda torre: Agenda.sequencia(torre._evento),
+            lambda torre: dormentes.get(id(torre), -1),
+        ))
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def restaurar(dados, assets=None):
+    """ Cria uma Simulation nova no estado capturado. Passe os assets já carregados para não ler as imagens de novo. """
+    from .Simulacao import Simulation
+
+    with np.load(io.BytesIO(dados), allow_pickle=False) as arquivo:
+        arrays = {nome: arquivo[nome] for nome in arquivo.files}
+
+    meta = json.loads(arrays["meta"].tobytes())
+    if meta["versao"] != VERSAO:
+        raise ValueError(f"Snapshot versão {meta['versao']}, esperada {VERSAO}")
+
+    linhas, colunas = meta["grid"]
+    sim = Simulation(assets=assets, semente=meta["semente"], linhas=linhas, colunas=colunas)
+
+    sim.tick = meta["tick"]
+    sim.total_energia = meta["total_energia"]
+    sim.proximo_spawn_inimigo = meta["proximo_spawn_inimigo"]
+    sim.proximo_spawn_energia = meta["proximo_spawn_energia"]
+    sim.contadores.update(meta["contadores"])
+
+    # TORRES (na ordem original da lista)
+    torres = []
+    eventos = [(meta["sequencia_spawns"][0], sim.agendar_spawn_inimigo),
+               (meta["sequencia_spawns"][1], sim.agendar_spawn_energia)]
+    dormentes = []
+    for classe in sim.TORRES:
+        campos = CAMPOS_TORRE + CAMPOS_POR_TORRE.get(classe, ())
+        for linha in arrays["torres_" + classe.__name__]:
+            ordem, row, col, sequencia, fila = (int(valor) for valor in linha[:5])
+            torre = classe(jogo=sim, pos=(linha[5], linha[6]), grid_pos=(row, col))
+            _aplicar(torre, campos, linha[5:])
+            torres.append((ordem, torre))
+            if sequencia >= 0:
+                eventos.append((sequencia, torre.agendar))
+            if fila >= 0:
+                dormentes.append((fila, torre))
+    torres.sort(key=lambda item: item[0])
+    sim.torres = [torre for _, torre in torres]
+    for torre in sim.torres:
+        sim.definir_celula(*torre.grid_pos, torre)
+
+    # ENERGIAS (as paradas voltam a dormir junto com os outros eventos)
+    for linha in arrays["energias"]:
+        energia_obj = Energia(jogo=sim, pos=(linha[1], linha[2]))
+        _aplicar(energia_obj, CAMPOS_ENERGIA, linha[1:])
+        if energia_obj.expira_em is not None:
+            energia_obj.expira_em = int(energia_obj.expira_em)
+            sim.energias_caindo.append(energia_obj)
+            eventos.append((int(linha[0]), lambda energia_obj=energia_obj: sim.adormecer_energia(energia_obj)))
+        else:
+            sim.adicionar_energia(energia_obj)
+
+    # AGENDA: os eventos são refeitos na ordem em que tinham sido agendados
+    for _, agendar in sorted(eventos, key=lambda item: item[0]):
+        agendar()
+    dormentes.sort(key=lambda item: item[0])
+    for _, torre in dormentes:
+        sim.peashooters_dormentes[torre.grid_pos[0]].append(torre)
+
+    # INIMIGOS
+    for linha in arrays["inimigos"]:
+        tipo = meta["tipos_inimigo"][int(linha[0])]
+        inimigo = Inimigo(jogo=sim, tipo=tipo, pos=(linha[2], linha[3]), row=int(linha[1]))
+        _aplicar(inimigo, CAMPOS_INIMIGO, linha[1:])
+        sim.inimigos.append(inimigo)
+        sim.indice_inimigos.inserir(inimigo)
+    sim.indice_inimigos.consumir_entradas()  # Não são entradas novas: os dormentes continuam dormindo
+
+    sim.projeteis.carregar_estado(arrays["projeteis"])
+
+    # Por último: os construtores acima podem ter sorteado valores (ex.: Energia.y_parada)
+    versao_rng, gauss_rng = meta["rng"]
+    sim.rng.setstate((versao_rng, tuple(int(palavra) for palavra in arrays["rng"]), gauss_rng))
+    sim.particulas.rng.bit_generator.state = meta["rng_particulas"]
+
+    return sim
@@ -1,41 +1,69 @@
 # scripts/Torres.py
 
-import pygame
-import random
 import math
-from .Mecanicas import projetil 
+from .Mecanicas import SistemaParticulas
+from .Registro import log
+from .Agenda import Agenda
 
 
 class TorreBase:
     """ Classe base para todas as torres/plantas do jogo. """
+    
+    ANIMADA = False  # True se o desenho muda sozinho (o render parcial redesenha sempre)
+    
+    __slots__ = ("jogo", "tipo", "x", "y", "custo", "vida_maxima", "vida", "img", "grid_pos", "_rect",
+                 "removida", "_evento")
+    
     def __init__(self, jogo, tipo, pos, custo, vida_maxima):
         self.jogo = jogo
         self.tipo = tipo
-        self.pos = list(pos)
+        self.x = float(pos[0])
+        self.y = float(pos[1])
         self.custo = custo
         self.vida_maxima = vida_maxima
         self.vida = vida_maxima
         
-        try:
-            self.img = jogo.assets["torre"][tipo]
-        except KeyError:
-             print(f"ERRO: Asset 'torre' do tipo '{tipo}' não encontrado. Usando placeholder.")
-             self.img = pygame.Surface((40, 40))
-             self.img.fill((0, 150, 0))
+        # Asset faltando vira placeholder no próprio GerenciadorAssets
+        self.img = jogo.assets.imagem("torre", tipo)
+        
+        # Torres não se movem: o rect é calculado uma vez só
+        self._rect = self.img.get_rect(topleft=(self.x, self.y))
+        
+        # Torres não têm update por tick: agem por eventos na jogo.agenda
+        self.removida = False
+        self._evento = None
+        
+    @property
+    def pos(self):
+        return (self.x, self.y)
         
     def rect(self):
-        return self.img.get_rect(topleft=self.pos)
+        """ Rect da torre (o mesmo objeto sempre; não modificar). """
+        return self._rect
+    
+    def agendar(self):
+        """ Registra os eventos da torre na agenda (ao plantar e ao restaurar um Snapshot). """
+        pass
     
-    def update(self):
-        # Retorna True se a torre deve ser removida
-        return self.vida <= 0
+    def _agendar_em(self, tick, callback):
+        self._evento = self.jogo.agenda.agendar(tick, Agenda.FASE_TORRES, callback)
+    
+    def remover(self):
+        """ Tira a torre do jogo: cancela o evento pendente; a Simulation a tira
+        da lista e do grid no fim da fase das torres. """
+        self.removida = True
+        Agenda.cancelar(self._evento)
+        self._evento = None
+        self.jogo._torres_removidas = True
         
     def draw(self, display):
-        display.blit(self.img, (int(self.pos[0]), int(self.pos[1])))
+        display.blit(self.img, (int(self.x), int(self.y)))
 
     def receber_dano(self, dano):
         """ Aplica dano à torre. """
         self.vida -= dano
+        if self.vida <= 0 and not self.removida:
+            self.remover()
         
 
 class Peashooter(TorreBase): 
@@ -43,45 +71,39 @@ class Peashooter(TorreBase):
 
     CUSTO_ENERGIA = 100 
     
+    __slots__ = ("pronto_em", "pos_disparo")
+    
     def __init__(self, jogo, pos, grid_pos): 
         super().__init__(jogo, "peashooter", pos, self.CUSTO_ENERGIA, 6) 
         
-        # Cooldown para atirar (começa pronto para atirar)
-        self.cooldown = 0 
+        # Tick em que o cooldown acaba (começa pronto para atirar)
+        self.pronto_em = 0 
         self.grid_pos = grid_pos
-
-    def update(self):
-        """Atualiza a torre e verifica se deve atirar."""
-        
-        # Decrementa o cooldown
-        if self.cooldown > 0:
-            self.cooldown -= 1
         
-        # Verifica se há inimigos na mesma linha
-        alvo_encontrado = False
+        # Posição de spawn do projétil (na frente da torre); a torre não se move
+        self.pos_disparo = (self.x + self._rect.width * 0.7, self.y + self._rect.height * 0.3)
+
+    def agendar(self):
+        # Pronto (recém-plantado): procura alvo já na fase das torres do próximo tick
+        self._agendar_em(max(self.pronto_em, self.jogo.tick + 1), self.ficar_pronto)
+    
+    def ficar_pronto(self):
+        """ Evento: o cooldown acabou. Atira agora ou dorme até entrar inimigo na linha. """
+        self._evento = None
+        if not self.atirar_se_houver_alvo():
+            self.jogo.peashooters_dormentes[self.grid_pos[0]].append(self)
+
+    def atirar_se_houver_alvo(self):
+        """ Atira se houver inimigo na linha, à direita. Retorna True se atirou. """
         
-        # Pega a linha da torre
+        # Verifica se há algum inimigo na mesma linha, na frente (à direita) da torre
         torre_row = self.grid_pos[0]
-        torre_center_y = self.jogo.get_cell_center(torre_row, self.grid_pos[1])[1]
-        
-        # Verifica se há algum inimigo na mesma linha (aproximadamente)
-        for inimigo in self.jogo.inimigos:
-            inimigo_center_y = inimigo.rect().centery
-            
-            # Tolerância de 40 pixels para detectar inimigos na mesma linha
-            diferenca_y = abs(inimigo_center_y - torre_center_y)
-            
-            # Verifica se o inimigo está na frente (à direita) da torre
-            if diferenca_y < 40 and inimigo.pos[0] > self.pos[0]:
-                alvo_encontrado = True
-                break
+        alvo_encontrado = self.jogo.indice_inimigos.existe_a_direita(torre_row, self.x)
         
-        # Se encontrou alvo e o cooldown acabou, atira
-        if alvo_encontrado and self.cooldown <= 0:
+        # Se encontrou alvo (o cooldown já acabou), atira
+        if alvo_encontrado:
             
-            # Posição de spawn do projétil (na frente da torre)
-            x_spawn = self.pos[0] + self.rect().width * 0.7 
-            y_spawn = self.pos[1] + self.rect().height * 0.3
+            x_spawn, y_spawn = self.pos_disparo
             
             # Cria partículas de disparo (opcional)
             self.jogo.criar_particulas(
@@ -92,24 +114,24 @@ class Peashooter(TorreBase):
                 vida_max=15,
                 gravidade=False,
                 tamanho_min=1,
-                tamanho_max=3
+                tamanho_max=3,
+                prioridade=SistemaParticulas.PRIORIDADE_BAIXA
             )
             
             # Cria o projétil
-            novo_projetil = projetil(
-                jogo=self.jogo,
-                tipo="proje", 
+            self.jogo.projeteis.disparar(
+                row=torre_row,
                 pos=(x_spawn, y_spawn), 
-                velocidade=[5, 0], 
+                velocidade_x=5, 
                 dano=1
             )
-            self.jogo.projeteis.append(novo_projetil)
             
-            # Reseta o cooldown para 84-90 frames (1.4s a 1.5s)
-            self.cooldown = random.randint(84, 90)
+            # Próximo tiro daqui a 84-90 ticks (1.4s a 1.5s)
+            self.pronto_em = self.jogo.tick + self.jogo.rng.randint(84, 90)
+            self._agendar_em(self.pronto_em, self.ficar_pronto)
+            return True
         
-        # Chama o update da classe base (verifica se morreu)
-        return super().update()
+        return False
 
 
 class NozObstaculo(TorreBase): 
@@ -117,15 +139,14 @@ class NozObstaculo(TorreBase):
     
     CUSTO_ENERGIA = 50 
     
+    __slots__ = ()
+    
     def __init__(self, jogo, pos, grid_pos): 
         VIDA_MAXIMA_NOZ = 40 
         
         super().__init__(jogo, "noz", pos, self.CUSTO_ENERGIA, VIDA_MAXIMA_NOZ) 
         self.grid_pos = grid_pos
-    
-    def update(self):
-        """Noz não ataca, apenas existe."""
-        return super().update()
+        # Noz não ataca, apenas existe (nenhum evento na agenda)
 
 
 class Girassol(TorreBase):
@@ -133,137 +154,150 @@ class Girassol(TorreBase):
     
     CUSTO_ENERGIA = 50
     ENERGIA_GERADA = 25  # Quantidade de energia gerada
+    PRIMEIRA_GERACAO = 480  # Ticks até o primeiro sol (8 segundos)
+    INTERVALO_GERACAO = (1200, 1440)  # Ticks entre os sóis seguintes (20-24 segundos)
+    
+    __slots__ = ("proxima_geracao", "cooldown_max", "primeira_geracao")
     
     def __init__(self, jogo, pos, grid_pos):
         super().__init__(jogo, "girassol", pos, self.CUSTO_ENERGIA, 6)
         self.grid_pos = grid_pos
         
-        # Cooldown para gerar energia
-        # Primeira geração: 8 segundos (480 frames a 60 FPS)
-        # Gerações seguintes: 20-24 segundos (1200-1440 frames)
-        self.cooldown_geracao = 480  # 8 segundos para o primeiro sol
-        self.cooldown_max = 1440  # 24 segundos
+        # Tick (absoluto) da próxima geração de energia
+        # Primeira geração: 8 segundos (480 ticks a 60 por segundo)
+        # Gerações seguintes: 20-24 segundos (1200-1440 ticks)
+        self.proxima_geracao = jogo.tick + self.PRIMEIRA_GERACAO  # 8 segundos para o primeiro sol
+        self.cooldown_max = self.INTERVALO_GERACAO[1]  # 24 segundos
         self.primeira_geracao = True  # Flag para controlar o primeiro sol
         
-    def update(self):
-        """Atualiza a torre e gera energia periodicamente."""
+    def agendar(self):
+        self._agendar_em(self.proxima_geracao, self.gerar_energia)
         
-        # Decrementa o cooldown
-        if self.cooldown_geracao > 0:
-            self.cooldown_geracao -= 1
+    def gerar_energia(self):
+        """ Evento: gera uma energia e agenda a próxima. """
+        # Posição onde a energia vai aparecer (em cima do girassol)
+        moeda_x = self.rect().centerx - self.jogo.assets.imagem("energia", "energia").get_width() // 2
+        moeda_y = self.rect().top - self.jogo.assets.imagem("energia", "energia").get_height()  # Acima do girassol
         
-        # Quando o cooldown chega a 0, gera energia
-        if self.cooldown_geracao <= 0:
-            # Posição onde a energia vai aparecer (em cima do girassol)
-            moeda_x = self.rect().centerx - self.jogo.assets["Energia"].get_width() // 2
-            moeda_y = self.rect().top - self.jogo.assets["Energia"].get_height()  # Acima do girassol
-            
-            # Cria o objeto Energia com "pulinho" (velocidade inicial para cima e para baixo)
-            from .Mecanicas import Energia
-            
-            # Calcula onde a energia deve parar (posição mais natural e variada)
-            # Pode cair em várias posições ao redor do girassol
-            
-            # Offset horizontal: -30 a +30 pixels do centro do girassol
-            offset_x = random.randint(-30, 30)
-            x_parada = self.rect().centerx + offset_x
-            
-            # Altura: entre o topo do girassol e um pouco abaixo (mais natural)
-            y_min = self.rect().top + 10
-            y_max = self.rect().bottom + 20
-            y_parada_girassol = random.randint(y_min, y_max)
-            
-            # Velocidade horizontal aleatória (leve movimento lateral)
-            vel_x = random.uniform(-0.5, 0.5)
-            
-            nova_energia = Energia(
-                jogo=self.jogo,
-                pos=(moeda_x, moeda_y),
-                velocidade=[vel_x, -2],  # Velocidade inicial: sobe + movimento lateral leve
-                valor=self.ENERGIA_GERADA,
-                vida=480,  # Mesma duração das energias do céu
-                onda=True  # Usa o efeito de onda para "cair" e parar
-            )
-            # Sobrescreve o y_parada para ficar perto do girassol (mais natural)
-            nova_energia.y_parada = y_parada_girassol
-            nova_energia.x_parada = x_parada  # Define onde deve parar horizontalmente
-            
-            self.jogo.energias_caindo.append(nova_energia)
-            
-            # Partículas douradas ao criar a energia
-            self.jogo.criar_particulas(
-                pos=self.rect().center,
-                cor=(255, 215, 0),  # Dourado
-                num_particulas=10,
-                velocidade_max=1.0,
-                vida_max=20,
-                gravidade=False,
-                tamanho_min=2,
-                tamanho_max=4
-            )
-            
-            # Mensagem de feedback
-            print(f"Girassol produziu energia! Clique para coletar.")
-            
-            # Reseta o cooldown
-            if self.primeira_geracao:
-                # Após o primeiro sol, muda para geração padrão
-                self.cooldown_geracao = random.randint(1200, 1440)  # 20-24 segundos
-                self.primeira_geracao = False
-            else:
-                # Gerações subsequentes: 20-24 segundos
-                self.cooldown_geracao = random.randint(1200, 1440)
-        
-        # Chama o update da classe base (verifica se morreu)
-        return super().update()
+        # Cria o objeto Energia com "pulinho" (velocidade inicial para cima e para baixo)
+        from .Mecanicas import Energia
+        
+        # Calcula onde a energia deve parar (posição mais natural e variada)
+        # Pode cair em várias posições ao redor do girassol
+        
+        # Offset horizontal: -30 a +30 pixels do centro do girassol
+        offset_x = self.jogo.rng.randint(-30, 30)
+        x_parada = self.rect().centerx + offset_x
+        
+        # Altura: entre o topo do girassol e um pouco abaixo (mais natural)
+        y_min = self.rect().top + 10
+        y_max = self.rect().bottom + 20
+        y_parada_girassol = self.jogo.rng.randint(y_min, y_max)
+        
+        # Velocidade horizontal aleatória (leve movimento lateral)
+        vel_x = self.jogo.rng.uniform(-0.5, 0.5)
+        
+        nova_energia = Energia(
+            jogo=self.jogo,
+            pos=(moeda_x, moeda_y),
+            velocidade=[vel_x, -2],  # Velocidade inicial: sobe + movimento lateral leve
+            valor=self.ENERGIA_GERADA,
+            vida=480,  # Mesma duração das energias do céu
+            onda=True  # Usa o efeito de onda para "cair" e parar
+        )
+        # Sobrescreve o y_parada para ficar perto do girassol (mais natural)
+        nova_energia.y_parada = y_parada_girassol
+        nova_energia.x_parada = x_parada  # Define onde deve parar horizontalmente
+        
+        self.jogo.adicionar_energia(nova_energia)
+        
+        # Partículas douradas ao criar a energia
+        self.jogo.criar_particulas(
+            pos=self.rect().center,
+            cor=(255, 215, 0),  # Dourado
+            num_particulas=10,
+            velocidade_max=1.0,
+            vida_max=20,
+            gravidade=False,
+            tamanho_min=2,
+            tamanho_max=4,
+            prioridade=SistemaParticulas.PRIORIDADE_BAIXA
+        )
+        
+        # Mensagem de feedback
+        self.jogo.contadores["sois_produzidos"] += 1
+        log.info("Girassol produziu energia! Clique para coletar.")
+        
+        # Agenda o próximo sol
+        if self.primeira_geracao:
+            # Após o primeiro sol, muda para geração padrão
+            self.proxima_geracao = self.jogo.tick + self.jogo.rng.randint(*self.INTERVALO_GERACAO)  # 20-24 segundos
+            self.primeira_geracao = False
+        else:
+            # Gerações subsequentes: 20-24 segundos
+            self.proxima_geracao = self.jogo.tick + self.jogo.rng.randint(*self.INTERVALO_GERACAO)
+        self._agendar_em(self.proxima_geracao, self.gerar_energia)
 
 
 class CerejaBomba(TorreBase):
     """Torre explosiva que detona após alguns segundos, matando todos os inimigos em área 3x3."""
     
     CUSTO_ENERGIA = 150
+    ANIMADA = True  # Pisca antes de explodir
+    
+    __slots__ = ("explode_em", "explodiu")
     
     def __init__(self, jogo, pos, grid_pos):
         super().__init__(jogo, "cereja", pos, self.CUSTO_ENERGIA, 999)  # Vida alta, não recebe dano
         self.grid_pos = grid_pos
         
-        # Tempo até explodir: 3 segundos (180 frames a 60 FPS)
-        self.tempo_explosao = 180
+        # Tick da explosão: daqui a 3 segundos (180 ticks a 60 por segundo)
+        self.explode_em = jogo.tick + 180
         self.explodiu = False
         
-    def update(self):
-        """Atualiza a cereja e explode quando o tempo acaba."""
+    @property
+    def tempo_explosao(self):
+        """ Ticks que faltam para explodir. """
+        return max(0, self.explode_em - self.jogo.tick)
         
-        # Decrementa o tempo até a explosão
-        if self.tempo_explosao > 0:
-            self.tempo_explosao -= 1
-            
-            # Efeito visual de "piscada" nos últimos segundos (60 frames = 1 segundo)
-            if self.tempo_explosao <= 60 and self.tempo_explosao % 10 == 0:
-                # Partículas de aviso (pisca vermelho)
-                self.jogo.criar_particulas(
-                    pos=self.rect().center,
-                    cor=(255, 100, 0),  # Laranja/Vermelho
-                    num_particulas=5,
-                    velocidade_max=0.5,
-                    vida_max=10,
-                    gravidade=False,
-                    tamanho_min=2,
-                    tamanho_max=4
-                )
+    def agendar(self):
+        # Acorda a cada piscada do último segundo (faltando 60, 50, ..., 10) e na explosão
+        restante = self.tempo_explosao
+        proxima = min(60, restante - 1) // 10 * 10 if restante > 0 else 0
+        self._agendar_em(self.explode_em - max(proxima, 0), self.acordar)
+        
+    def acordar(self):
+        """ Evento: pisca (último segundo) e explode quando o tempo acaba. """
+        self._evento = None
+        
+        # Efeito visual de "piscada" no último segundo (60 ticks): todo evento antes da explosão é uma piscada
+        if self.tempo_explosao <= 60:
+            # Partículas de aviso (pisca vermelho)
+            self.jogo.criar_particulas(
+                pos=self.rect().center,
+                cor=(255, 100, 0),  # Laranja/Vermelho
+                num_particulas=5,
+                velocidade_max=0.5,
+                vida_max=10,
+                gravidade=False,
+                tamanho_min=2,
+                tamanho_max=4,
+                prioridade=SistemaParticulas.PRIORIDADE_BAIXA
+            )
         
         # Quando o tempo chega a 0, EXPLODE!
         if self.tempo_explosao <= 0 and not self.explodiu:
             self.explodir()
             self.explodiu = True
-            return True  # Remove a cereja após explodir
-        
-        return False  # Não remove ainda
+            self.remover()  # Remove a cereja após explodir
+        else:
+            self.agendar()
     
     def explodir(self):
         """Causa a explosão em área 3x3."""
         
-        print("💥 CEREJA-BOMBA EXPLODIU!")
+        self.jogo.contadores["explosoes"] += 1
+        log.info("💥 CEREJA-BOMBA EXPLODIU!")
         
         # Calcula a área de explosão (3x3 células ao redor)
         centro_row, centro_col = self.grid_pos
@@ -272,11 +306,11 @@ class CerejaBomba(TorreBase):
         raio_explosao_cells = 1  # 1 célula ao redor = área 3x3
         
         # Pega as dimensões das células
-        cell_width = self.jogo.CELL_WIDTH
-        cell_height = self.jogo.CELL_HEIGHT
+        cell_width = self.jogo.geometria.largura_celula
+        cell_height = self.jogo.geometria.altura_celula
         
         # Calcula o centro da explosão em pixels
-        centro_x, centro_y = self.jogo.get_cell_center(centro_row, centro_col)
+        centro_x, centro_y = self.jogo.geometria.centro(centro_row, centro_col)
         
         # Raio de explosão em pixels (1.5 células = área 3x3)
         raio_pixels = int(1.5 * max(cell_width, cell_height))
@@ -291,7 +325,8 @@ class CerejaBomba(TorreBase):
             vida_max=60,
             gravidade=True,
             tamanho_min=3,
-            tamanho_max=8
+            tamanho_max=8,
+            prioridade=SistemaParticulas.PRIORIDADE_ALTA
         )
         
         # 2. Partículas vermelhas (fogo)
@@ -303,7 +338,8 @@ class CerejaBomba(TorreBase):
             vida_max=50,
             gravidade=True,
             tamanho_min=2,
-            tamanho_max=6
+            tamanho_max=6,
+            prioridade=SistemaParticulas.PRIORIDADE_ALTA
         )
         
         # 3. Partículas amarelas (luz)
@@ -315,13 +351,20 @@ class CerejaBomba(TorreBase):
             vida_max=40,
             gravidade=False,
             tamanho_min=2,
-            tamanho_max=5
+            tamanho_max=5,
+            prioridade=SistemaParticulas.PRIORIDADE_ALTA
         )
         
         # DANO AOS INIMIGOS
-        inimigos_mortos = 0
-        for i in range(len(self.jogo.inimigos) - 1, -1, -1):
-            inimigo = self.jogo.inimigos[i]
+        # Só as linhas vizinhas (r-1..r+1) e a faixa de x do raio podem ser atingidas
+        candidatos = []
+        for row in range(centro_row - 1, centro_row + 2):
+            candidatos.extend(
+                self.jogo.indice_inimigos.no_intervalo(row, centro_x - raio_pixels, centro_x + raio_pixels + 1)
+            )
+        
+        atingidos = []
+        for inimigo in candidatos:
             
             # Calcula a distância do inimigo ao centro da explosão
             distancia_x = abs(inimigo.rect().centerx - centro_x)
@@ -337,13 +380,18 @@ class CerejaBomba(TorreBase):
                     num_particulas=30,
                     velocidade_max=4,
                     vida_max=50,
-                    gravidade=True
+                    gravidade=True,
+                    prioridade=SistemaParticulas.PRIORIDADE_ALTA
                 )
                 
-                self.jogo.inimigos.pop(i)
-                inimigos_mortos += 1
+                atingidos.append(inimigo)
+
+        # Todos saem de uma vez (sem list.remove por inimigo)
+        self.jogo.remover_inimigos(atingidos)
+        inimigos_mortos = len(atingidos)
         
-        print(f"💀 Cereja-Bomba matou {inimigos_mortos} inimigos!")
+        self.jogo.contadores["inimigos_explodidos"] += inimigos_mortos
+        log.info("💀 Cereja-Bomba matou %s inimigos!", inimigos_mortos)
     
     def draw(self, display):
         """Desenha a cereja com efeito de piscada quando próximo da explosão."""
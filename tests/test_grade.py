@@ -0,0 +1,37 @@
+# Rodar da pasta que contém scripts/:  python -m pytest scripts/tests
+
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+from scripts.Simulacao import Simulation
+from scripts.Torres import Peashooter
+
+
+def _grid_largo():
+    """ Grid mais largo que a tela (13 colunas: x_fim = 895 > 800), com Peashooters na última coluna. """
+    sim = Simulation(semente=0, colunas=13)
+    sim.total_energia = 10 ** 6
+    for row in range(sim.GRID_ROWS):
+        sim.colocar_torre(Peashooter, row, sim.GRID_COLS - 1)
+    return sim
+
+
+def test_inimigos_entram_fora_do_grid():
+    sim = _grid_largo()
+    while not sim.inimigos and sim.tick < 1000:
+        sim.step(1)
+
+    assert sim.inimigos
+    for inimigo in sim.inimigos:
+        assert inimigo.x >= sim.geometria.x_fim
+
+
+def test_projetil_da_ultima_coluna_sobrevive():
+    sim = _grid_largo()
+    while len(sim.projeteis) == 0 and sim.tick < 1000:
+        sim.step(1)
+
+    assert len(sim.projeteis) > 0
+    sim.step(1)
+    assert len(sim.projeteis) > 0